@@ -273,6 +273,14 @@ class PsalmConfig(BaseModel):
         default=None,
         description='Optional path to a MIDI file for melodic input. Overrides internal pitch settings if provided.'
     )
+    use_gpu: bool = Field(
+        default=False,
+        description="Run melody-contour pitch shifts with torchaudio, on CUDA when available. Requires torch and torchaudio, which are not installed by default; falls back to librosa otherwise."
+    )
+    use_wsola: bool = Field(
+        default=False,
+        description="Time-stretch words for duration control with WSOLA (waveform similarity overlap-add), which keeps speech transients sharper than the phase vocoder. Used for stretch rates between 0.7 and 1.4; larger changes still use the phase vocoder."
+    )
 
     vocal_timbre: VocalTimbre = Field(
         default_factory=VocalTimbre,
@@ -12,6 +12,8 @@ from typing import Literal
 from typing import Literal, cast
 import random # For glitch probability
 from pedalboard import Distortion, LowpassFilter, Compressor, Limiter # Added for saturation and dynamics
+from functools import lru_cache # Cache filter designs across calls
+from numba import njit # Chorus delay-line kernel; already required by librosa
 # Removed module-level seed
 
 # Pedalboard's Reverb defaults: room_size=0.5, damping=0.5, wet_level=0.33, dry_level=0.4, width=1.0, freeze_mode=0.0
@@ -361,27 +363,22 @@ def apply_robust_formant_shift(audio: np.ndarray, sample_rate: int, params: Form
     return shifted_audio
 
 
-def apply_rbj_lowpass_filter(audio: np.ndarray, sample_rate: int, params: ResonantFilterParameters) -> np.ndarray:
+@lru_cache(maxsize=8)
+def _design_rbj_lowpass_sos(sample_rate: int, cutoff_hz: float, q: float) -> np.ndarray:
     """
-    Applies a resonant low-pass filter using RBJ Biquad design (zero-phase).
+    Designs (and caches) the RBJ low-pass biquad as second-order sections.
+
+    The synthesis chain nearly always runs with the same sample rate and filter
+    settings, so the design is memoized on its (already clipped) arguments.
 
     Args:
-        audio: Input audio signal as a NumPy array (mono or stereo).
         sample_rate: Sample rate of the audio signal.
-        params: An instance of ResonantFilterParameters containing cutoff frequency and Q.
+        cutoff_hz: Cutoff frequency in Hz, already clipped below Nyquist.
+        q: Resonance (Q factor), already clamped to a positive minimum.
 
     Returns:
-        The processed audio signal with the filter applied (float32).
+        The SOS coefficient array of shape (1, 6). Callers must not modify it.
     """
-    if audio.size == 0:
-        return np.array([], dtype=np.float32) # Return float32 for consistency
-
-    nyquist = sample_rate / 2.0
-    # Clip cutoff frequency to be slightly below Nyquist to avoid issues with filter design
-    cutoff_hz = np.clip(params.cutoff_hz, 0.01, nyquist * 0.999) # Ensure cutoff is positive and below Nyquist
-    # Ensure Q is positive and reasonably small if zero/negative provided (avoids instability)
-    q = max(0.1, params.q) # Use 0.1 as a minimum Q
-
     # RBJ Lowpass Filter coefficient calculation (from RBJ Audio EQ Cookbook)
     w0 = 2 * math.pi * cutoff_hz / sample_rate
     alpha = math.sin(w0) / (2 * q)
@@ -400,11 +397,104 @@ def apply_rbj_lowpass_filter(audio: np.ndarray, sample_rate: int, params: Resona
 
     # Convert to second-order sections (SOS) for numerical stability
     sos = signal.tf2sos(b, a)
+    return sos
+
+
+@lru_cache(maxsize=8)
+def _design_bandpass_sos(order: int, low_normalized: float, high_normalized: float) -> np.ndarray:
+    """
+    Designs (and caches) a Butterworth bandpass filter as second-order sections.
+
+    Args:
+        order: Filter order.
+        low_normalized: Lower cutoff, normalized to Nyquist (0 to 1).
+        high_normalized: Upper cutoff, normalized to Nyquist (0 to 1).
+
+    Returns:
+        The SOS coefficient array. Callers must not modify it.
+    """
+    sos = signal.butter(N=order, Wn=[low_normalized, high_normalized], btype='bandpass', output='sos')
+    return sos
+
+
+@lru_cache(maxsize=8)
+def _sos_steady_state(sos_bytes: bytes, n_sections: int) -> np.ndarray:
+    """
+    Computes (and caches) `sosfilt_zi` for an SOS design, keyed by its raw coefficients.
+
+    Args:
+        sos_bytes: The float64 SOS coefficient array as bytes (`sos.tobytes()`).
+        n_sections: Number of second-order sections in the design.
+
+    Returns:
+        The unit-step steady-state filter state of shape (n_sections, 2). Callers must not modify it.
+    """
+    sos = np.frombuffer(sos_bytes, dtype=np.float64).reshape(n_sections, 6)
+    return signal.sosfilt_zi(sos)
+
+
+def _apply_sos(sos: np.ndarray, audio_float: np.ndarray, zero_phase: bool) -> np.ndarray:
+    """
+    Runs an SOS filter along axis 0, either zero-phase or as a single causal pass.
+
+    The causal pass starts from the filter's steady state for the first input
+    sample (`sosfilt_zi`), which avoids the start-up transient of a zero initial
+    state and works for inputs of any length.
+
+    Args:
+        sos: Second-order sections of the filter.
+        audio_float: Input audio (mono or multi-channel, samples along axis 0).
+        zero_phase: If True, use `sosfiltfilt` (forward-backward); otherwise a single `sosfilt` pass.
+
+    Returns:
+        The filtered audio.
+    """
+    if zero_phase:
+        return signal.sosfiltfilt(sos, audio_float, axis=0)
+
+    # Shape (n_sections, 2), unit-step steady state; the designs are cached, so is this
+    zi = _sos_steady_state(np.asarray(sos, dtype=np.float64).tobytes(), sos.shape[0])
+    if audio_float.ndim == 1:
+        zi = zi * audio_float[0]
+    else:
+        # sosfilt expects zi of shape (n_sections, 2, channels) when filtering along axis 0
+        zi = zi[:, :, np.newaxis] * audio_float[0][np.newaxis, np.newaxis, :]
+    filtered_audio, _ = signal.sosfilt(sos, audio_float, axis=0, zi=zi)
+    return filtered_audio
+
+
+def apply_rbj_lowpass_filter(audio: np.ndarray, sample_rate: int, params: ResonantFilterParameters, zero_phase: bool = True) -> np.ndarray:
+    """
+    Applies a resonant low-pass filter using RBJ Biquad design (zero-phase by default).
+
+    Args:
+        audio: Input audio signal as a NumPy array (mono or stereo).
+        sample_rate: Sample rate of the audio signal.
+        params: An instance of ResonantFilterParameters containing cutoff frequency and Q.
+        zero_phase: If True (default), filter forward and backward (sosfiltfilt).
+            If False, run a single causal pass initialised to the first sample's
+            steady state, which halves the filtering work.
+
+    Returns:
+        The processed audio signal with the filter applied (float32).
+    """
+    if audio.size == 0:
+        return np.array([], dtype=np.float32) # Return float32 for consistency
+
+    nyquist = sample_rate / 2.0
+    # Clip cutoff frequency to be slightly below Nyquist to avoid issues with filter design
+    cutoff_hz = np.clip(params.cutoff_hz, 0.01, nyquist * 0.999) # Ensure cutoff is positive and below Nyquist
+    # Ensure Q is positive and reasonably small if zero/negative provided (avoids instability)
+    q = max(0.1, params.q) # Use 0.1 as a minimum Q
 
-    # Apply filter using sosfiltfilt (zero-phase filtering)
-    # Process in float32 for consistency
-    audio_float = audio.astype(np.float32)
-    filtered_audio = signal.sosfiltfilt(sos, audio_float, axis=0)
+    # Design (or reuse) the SOS coefficients for this configuration
+    sos = _design_rbj_lowpass_sos(sample_rate, float(cutoff_hz), float(q))
+
+    # Apply filter (zero-phase sosfiltfilt by default)
+    # Process in float32 for consistency (no copy when the input already is;
+    # the scipy filters copy into their own working buffer)
+    audio_float = np.asarray(audio, dtype=np.float32)
+    filtered_audio = _apply_sos(sos, audio_float, zero_phase)
 
     # Ensure output shape matches input channel count
     if audio.ndim == 1 and filtered_audio.ndim == 2 and filtered_audio.shape[1] == 1:
@@ -416,14 +506,17 @@ def apply_rbj_lowpass_filter(audio: np.ndarray, sample_rate: int, params: Resona
     return filtered_audio.astype(np.float32)
 
 
-def apply_bandpass_filter(audio: np.ndarray, sample_rate: int, params: BandpassFilterParameters) -> np.ndarray:
+def apply_bandpass_filter(audio: np.ndarray, sample_rate: int, params: BandpassFilterParameters, zero_phase: bool = True) -> np.ndarray:
     """
-    Applies a bandpass filter effect using a Butterworth filter (sosfiltfilt, zero-phase).
+    Applies a bandpass filter effect using a Butterworth filter (sosfiltfilt, zero-phase by default).
 
     Args:
         audio: Input audio signal as a NumPy array (mono or stereo).
         sample_rate: Sample rate of the audio signal.
         params: An instance of BandpassFilterParameters containing center frequency, Q, and order.
+        zero_phase: If True (default), filter forward and backward (sosfiltfilt).
+            If False, run a single causal pass initialised to the first sample's
+            steady state, which halves the filtering work.
 
     Returns:
         The processed audio signal with the filter applied (float32).
@@ -473,14 +566,15 @@ def apply_bandpass_filter(audio: np.ndarray, sample_rate: int, params: BandpassF
     low_normalized = low_cutoff_clipped / nyquist
     high_normalized = high_cutoff_clipped / nyquist
 
-    # Design the Butterworth bandpass filter using second-order sections (SOS)
+    # Design (or reuse) the Butterworth bandpass filter using second-order sections (SOS)
     # Use the order specified in params
-    sos = signal.butter(N=params.order, Wn=[low_normalized, high_normalized], btype='bandpass', output='sos')
+    sos = _design_bandpass_sos(params.order, float(low_normalized), float(high_normalized))
 
-    # Apply the filter using sosfiltfilt (zero-phase filtering)
-    # Process in float32 for consistency
-    audio_float = audio.astype(np.float32)
-    filtered_audio = signal.sosfiltfilt(sos, audio_float, axis=0)
+    # Apply the filter (zero-phase sosfiltfilt by default)
+    # Process in float32 for consistency (no copy when the input already is;
+    # the scipy filters copy into their own working buffer)
+    audio_float = np.asarray(audio, dtype=np.float32)
+    filtered_audio = _apply_sos(sos, audio_float, zero_phase)
 
     # Ensure output shape matches input channel count
     if audio.ndim == 1 and filtered_audio.ndim == 2 and filtered_audio.shape[1] == 1:
@@ -492,6 +586,64 @@ def apply_bandpass_filter(audio: np.ndarray, sample_rate: int, params: BandpassF
     return filtered_audio.astype(np.float32)
 
 
+@njit(cache=True)
+def _chorus_wet(
+    channels: np.ndarray,
+    lfo: np.ndarray,
+    static_offsets: np.ndarray,
+    base_delay_samples: float,
+    max_variation_samples: float,
+    buffer_size: int,
+    feedback: np.float32,
+) -> np.ndarray:
+    """Run the chorus voices' modulated feedback delay lines over (samples, channels) audio.
+
+    Each voice reads its delay line with linear interpolation at
+    `base_delay_samples + static_offsets[voice] + max_variation_samples * lfo[n]`
+    and writes the input plus `feedback` times its output back, clipped to [-1, 1].
+    Returns the voices' average (the wet signal). Compiled with numba.
+    """
+    num_samples, num_channels = channels.shape
+    num_voices = static_offsets.shape[0]
+    delay_buffers = np.zeros((num_voices, num_channels, buffer_size), dtype=np.float32)
+    write_pointers = np.zeros(num_voices, dtype=np.int64)
+    wet_signal = np.zeros((num_samples, num_channels), dtype=np.float32)
+    total_delayed = np.zeros(num_channels, dtype=np.float32)
+    delayed = np.zeros(num_channels, dtype=np.float32)
+
+    for n in range(num_samples):
+        total_delayed[:] = 0.0
+        for i in range(num_voices):
+            # Time-varying delay for this voice, kept inside the buffer
+            current_delay_samples = base_delay_samples + (static_offsets[i] + max_variation_samples * lfo[n])
+            current_delay_samples = min(max(current_delay_samples, 1.0), buffer_size - 2.0)
+
+            read_pos_frac = write_pointers[i] - current_delay_samples
+            read_idx_0 = int(np.floor(read_pos_frac))
+            frac = read_pos_frac - read_idx_0
+            read_idx_1 = (read_idx_0 + 1) % buffer_size # Python-style modulo wraps negatives
+            read_idx_0 = read_idx_0 % buffer_size
+
+            for ch in range(num_channels):
+                y0 = delay_buffers[i, ch, read_idx_0]
+                y1 = delay_buffers[i, ch, read_idx_1]
+                delayed[ch] = y0 + frac * (y1 - y0)
+                total_delayed[ch] += delayed[ch]
+
+            # Feedback into the delay line, clipped to prevent runaway with high feedback
+            for ch in range(num_channels):
+                buffer_input = channels[n, ch] + feedback * delayed[ch]
+                delay_buffers[i, ch, write_pointers[i]] = min(max(buffer_input, np.float32(-1.0)), np.float32(1.0))
+
+            write_pointers[i] = (write_pointers[i] + 1) % buffer_size
+
+        # Average the delayed samples across voices
+        for ch in range(num_channels):
+            wet_signal[n, ch] = total_delayed[ch] / num_voices
+
+    return wet_signal
+
+
 def apply_chorus(audio: np.ndarray, sample_rate: int, params: ChorusParameters) -> np.ndarray:
     """
     Applies a multi-voice chorus effect manually using modulated delay lines and feedback.
@@ -521,8 +673,9 @@ def apply_chorus(audio: np.ndarray, sample_rate: int, params: ChorusParameters)
     max_variation_samples = max(0, max_variation_samples) # Ensure non-negative
 
     rate_hz = params.rate_hz
-    feedback = np.clip(params.feedback, 0.0, 0.98) # Clip feedback slightly below 1 for stability
-    mix = np.clip(params.wet_dry_mix, 0.0, 1.0)
+    # Keep scalar gains in float32: np.clip returns float64 scalars, which would upcast the signal math
+    feedback = np.float32(np.clip(params.feedback, 0.0, 0.98)) # Clip feedback slightly below 1 for stability
+    mix = np.float32(np.clip(params.wet_dry_mix, 0.0, 1.0))
 
     # --- LFO Generation ---
     t = np.arange(num_samples) / sample_rate
@@ -541,69 +694,16 @@ def apply_chorus(audio: np.ndarray, sample_rate: int, params: ChorusParameters)
     max_dynamic_delay = base_delay_samples + max_variation_samples
     buffer_size = int(np.ceil(max_dynamic_delay)) + 2 # Add margin for interpolation
 
-    # Create delay buffers (one per voice per channel)
-    delay_buffers_shape = (num_voices, num_channels, buffer_size)
-    delay_buffers = np.zeros(delay_buffers_shape, dtype=np.float32)
-    write_pointers = np.zeros(num_voices, dtype=int)
-
-    # --- Output Signal Initialization ---
-    wet_signal = np.zeros_like(audio_float32)
-
     # --- Sample-by-Sample Processing ---
-    for n in range(num_samples):
-        current_input = audio_float32[n] # Shape: (,) or (2,)
-        if not is_stereo:
-            current_input = np.array([current_input]) # Ensure shape (1,) for consistent indexing
-
-        total_delayed_sample_channels = np.zeros(num_channels, dtype=np.float32)
-
-        for i in range(num_voices):
-            # Calculate time-varying delay for this voice
-            lfo_modulation = static_offsets[i] + max_variation_samples * lfo[n]
-            current_delay_samples = base_delay_samples + lfo_modulation
-            current_delay_samples = np.clip(current_delay_samples, 1.0, buffer_size - 2) # Ensure valid delay
-
-            # Calculate read position (fractional)
-            read_pos_frac = write_pointers[i] - current_delay_samples
-            read_idx_0 = int(np.floor(read_pos_frac))
-            read_idx_1 = read_idx_0 + 1
-            frac = read_pos_frac - read_idx_0
-
-            # Wrap buffer indices
-            read_idx_0 = (read_idx_0 % buffer_size + buffer_size) % buffer_size
-            read_idx_1 = (read_idx_1 % buffer_size + buffer_size) % buffer_size
-
-            # Linear interpolation for each channel
-            delayed_sample_channels = np.zeros(num_channels, dtype=np.float32)
-            for ch in range(num_channels):
-                y0 = delay_buffers[i, ch, read_idx_0]
-                y1 = delay_buffers[i, ch, read_idx_1]
-                delayed_sample_channels[ch] = y0 + frac * (y1 - y0)
-
-            # Accumulate delayed samples for the wet mix
-            total_delayed_sample_channels += delayed_sample_channels
-
-            # Calculate feedback input and write to buffer for each channel
-            for ch in range(num_channels):
-                 buffer_input = current_input[ch] + feedback * delayed_sample_channels[ch]
-                 # Clip buffer input to prevent extreme values with high feedback
-                 buffer_input = np.clip(buffer_input, -1.0, 1.0)
-                 delay_buffers[i, ch, write_pointers[i]] = buffer_input
-
-            # Increment write pointer for this voice
-            write_pointers[i] = (write_pointers[i] + 1) % buffer_size
-
-        # Average the delayed samples across voices
-        avg_delayed_sample = total_delayed_sample_channels / num_voices
-
-        # Store the averaged wet sample (shape (1,) or (2,))
-        if is_stereo:
-            wet_signal[n] = avg_delayed_sample
-        else:
-            wet_signal[n] = avg_delayed_sample[0]
+    # The feedback delay lines are recursive, so they run sample by sample in a compiled kernel
+    channels = audio_float32.reshape(num_samples, num_channels)
+    wet_signal = _chorus_wet(
+        channels, lfo, static_offsets.astype(np.float64), float(base_delay_samples),
+        float(max_variation_samples), buffer_size, feedback,
+    ).reshape(audio_float32.shape)
 
     # --- Mix wet and dry signals ---
-    output_signal = (audio_float32 * (1.0 - mix)) + (wet_signal * mix)
+    output_signal = (audio_float32 * (np.float32(1.0) - mix)) + (wet_signal * mix)
 
     # Ensure output length matches original input length (should already match)
     if output_signal.shape[0] != num_samples:
@@ -1034,7 +1134,7 @@ def apply_saturation(audio: np.ndarray, sample_rate: int, params: SaturationPara
         wet_signal = board_tone(wet_signal, sample_rate=sample_rate)
 
     # 3. Apply Mix
-    mix_clipped = np.clip(params.mix, 0.0, 1.0)
+    mix_clipped = np.float32(np.clip(params.mix, 0.0, 1.0)) # float32 scalar avoids upcasting the mix
 
     # Ensure shapes match for broadcasting before mixing.
     # Pedalboard effects can sometimes change channel count (e.g., mono input -> stereo output).
@@ -1058,7 +1158,7 @@ def apply_saturation(audio: np.ndarray, sample_rate: int, params: SaturationPara
     dry_signal = dry_signal[:min_len, ...]
     wet_signal = wet_signal[:min_len, ...]
 
-    output_signal = (dry_signal * (1.0 - mix_clipped)) + (wet_signal * mix_clipped)
+    output_signal = (dry_signal * (np.float32(1.0) - mix_clipped)) + (wet_signal * mix_clipped)
 
     # Ensure final output length matches original input length.
     # This handles cases where intermediate processing might have slightly altered length.
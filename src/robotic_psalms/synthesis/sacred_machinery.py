@@ -170,15 +170,10 @@ class SacredMachineryEngine:
             vocals = np.zeros(target_samples_for_layers, dtype=np.float32)
         else:
             max_len = max(len(layer) for layer in vocal_layers)
-            aligned_layers = []
+            # Sum layers directly into the output buffer (shorter layers are implicitly zero-padded)
+            mixed_vocals = np.zeros(max_len, dtype=np.float32)
             for layer in vocal_layers:
-                if len(layer) < max_len:
-                    aligned_layers.append(np.pad(layer, (0, max_len - len(layer)), mode='constant'))
-                else:
-                    aligned_layers.append(layer[:max_len]) # Trim if longer
-
-            # Sum layers
-            mixed_vocals = np.sum(np.array(aligned_layers), axis=0)
+                mixed_vocals[:len(layer)] += layer
 
             # Normalize the mixed result (using existing helper)
             vocals = self._normalize_audio(mixed_vocals)
@@ -581,15 +576,17 @@ class SacredMachineryEngine:
         base_harmonicity = self.config.celestial_harmonicity
         harmonicity = base_harmonicity * lfo_harmonicity # Effective range [0, base_harmonicity]
 
-        # Generate base waveform by summing oscillators
+        # Generate base waveform by summing oscillators.
+        # The sine/saw blend weights are shared by all oscillators, so the sine and
+        # sawtooth partials are summed first and blended once for the whole mode.
+        sine_sum = np.zeros(num_samples)
+        saw_sum = np.zeros(num_samples)
         for freq in frequencies:
-            # Mix sine and sawtooth waves based on time-varying harmonicity
-            sine = np.sin(2 * np.pi * freq * t)
-            saw = 2 * (t * freq - np.floor(0.5 + t * freq)) # Basic sawtooth
+            sine_sum += np.sin(2 * np.pi * freq * t)
+            saw_sum += 2 * (t * freq - np.floor(0.5 + t * freq)) # Basic sawtooth
 
-            # Ensure harmonicity is broadcastable if needed (should be same length as t)
-            wave = sine * (1 - harmonicity) + saw * harmonicity
-            pad += wave * self._PAD_OSC_GAIN # Use class constant for gain
+        # Mix sine and sawtooth waves based on time-varying harmonicity
+        pad += (sine_sum * (1 - harmonicity) + saw_sum * harmonicity) * self._PAD_OSC_GAIN # Use class constant for gain
 
         # Apply Time-Varying Low-Pass Filter using helper function
         pad = self._apply_time_varying_lowpass(
@@ -774,7 +771,7 @@ class SacredMachineryEngine:
         audio: npt.NDArray[np.float32],
         shift_samples: int
     ) -> npt.NDArray[np.float32]:
-        """Applies a timing shift to the audio using padding and slicing.
+        """Applies a timing shift to the audio by slicing into a zeroed output buffer.
 
         Args:
             audio: The input audio array.
@@ -785,19 +782,17 @@ class SacredMachineryEngine:
         Returns:
             The time-shifted audio array.
         """
-        current_len = len(audio)
-        if shift_samples > 0: # Shift earlier (pad start, trim end)
-            pad_width = (shift_samples, 0)
-            shifted_audio = np.pad(audio, pad_width, mode='constant')
-            return shifted_audio[:current_len] # Trim end to original length
-        elif shift_samples < 0: # Shift later (pad end, trim start)
-            shift_abs = abs(shift_samples)
-            pad_width = (0, shift_abs)
-            shifted_audio = np.pad(audio, pad_width, mode='constant')
-            return shifted_audio[shift_abs:shift_abs + current_len] # Trim start
-        else: # No shift
+        if shift_samples == 0: # No shift
             return audio
 
+        shifted_audio = np.zeros_like(audio)
+        shift_abs = min(abs(shift_samples), len(audio))
+        if shift_samples > 0: # Shift earlier (zero start, trim end)
+            shifted_audio[shift_abs:] = audio[:len(audio) - shift_abs]
+        else: # Shift later (trim start, zero end)
+            shifted_audio[:len(audio) - shift_abs] = audio[shift_abs:]
+        return shifted_audio
+
     def _apply_configured_saturation(
         self,
         audio: npt.NDArray[np.float32]
@@ -1,15 +1,25 @@
+import hashlib
+import itertools
+import json
 import logging
+import os
+import threading
 import typing  # Add typing import
-from typing import Optional, cast, List, Tuple, TypedDict, ClassVar # Added ClassVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, cast, List, Tuple, ClassVar, Mapping, Dict # Added ClassVar
 
 import numpy as np
 import numpy.typing as npt
 import librosa
 import librosa.effects
+from numba import njit # Already required by librosa
 import pyfoal
+import pyworld as pw # Fast C F0 estimation (DIO + StoneMask)
+import soundfile as sf # Debug stage snapshots (_dump); already loaded by EspeakNGWrapper
 # Removed incorrect 'from pyfoal import Word'
-# soundfile and Path moved into debug blocks later
-# soundfile is used implicitly by EspeakNGWrapper, but not directly here.
+import scipy.fft
 from scipy import signal
 
 # Removed top-level config import causing circular dependency
@@ -30,14 +40,177 @@ from .tts.engines.espeak import EspeakNGWrapper
 
 
 # Constants
-_MIN_SOSFILTFILT_LEN = 15 # Minimum length required by sosfiltfilt
 _MIN_PYIN_DURATION_SEC = 0.1 # Minimum duration for reliable pyin pitch estimation
+_PYIN_FRAME_LENGTH = 2048 # pyin analysis frame length (samples)
+_PYIN_HOP_LENGTH = 512 # pyin hop length (samples); segment frames are indexed with this
+_FMIN_HZ = float(librosa.note_to_hz('C2')) # Lowest F0 considered by contour pitch estimation
+_FMAX_HZ = float(librosa.note_to_hz('C7')) # Highest F0 considered by contour pitch estimation
+_F0_BACKEND = "pyworld" # F0 estimator for melody contour: "pyworld" (DIO + StoneMask) or "pyin"
+_PITCH_SR = 16000 # F0 estimation runs at this rate; vocal F0 (<= C7) is far below its Nyquist
+_PITCH_FRAME_LENGTH = 1024 # pyin frame length (samples) at _PITCH_SR
 _MIN_SEMITONE_SHIFT = 1e-3  # Minimum semitone shift to apply (avoids tiny shifts)
+_SHIFT_QUANTUM_SEMITONES = 0.1 # Contour shifts are rounded to 10 cents so equal shifts share one pass
+_FFT_WORKERS = os.cpu_count() or 1 # scipy.fft threads for librosa STFTs that are not already run in parallel
+_PARALLEL_STRETCH_MIN_WORDS = 8 # Duration control stretches words on a thread pool from this many words
+_ALIGNMENT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "robotic_psalms", "align") # On-disk pyfoal alignments
+_WSOLA_FRAME_LENGTH = 1024 # WSOLA frame (Hann window) length in samples
+_WSOLA_HOP_LENGTH = 512 # WSOLA synthesis hop (50% overlap)
+_WSOLA_SEARCH = 128 # WSOLA search radius around each nominal analysis position, in samples
+_WSOLA_MIN_RATE = 0.7 # WSOLA is used for stretch rates strictly between these (config.use_wsola)
+_WSOLA_MAX_RATE = 1.4
+_VOCODER_N_FFT = 2048 # STFT size of the shared contour phase vocoder (librosa's pitch_shift default)
+_VOCODER_HOP_LENGTH = 512 # STFT hop of the shared contour phase vocoder
+_VOCODER_MARGIN_FRAMES = 2 # Extra STFT frames vocoded on each side of a span to settle its edges
+_DEBUG_DUMP = False # Write a debug_vocals_*.wav snapshot after each processing stage
+_DEFAULT_BASE_FREQ = 130.81 # C3, the baseline for eSpeak pitch scaling
+# Base frequencies (Hz) for the supported voice ranges
+_BASE_FREQS: Mapping[str, float] = MappingProxyType({
+    "C2": 65.41, "G2": 98.00,  # Bass
+    "A2": 110.00, "D3": 146.83,  # Baritone
+    "C3": 130.81, "G3": 196.00,  # Tenor
+    "E3": 164.81, "C4": 261.63   # Counter-tenor
+})
 # _STRETCH_RATE_THRESHOLD moved inside the class
 
+
+_background_pool: Optional[ThreadPoolExecutor] = None # Shared by all synthesizers; see _get_background_pool
+_background_pool_lock = threading.Lock()
+
+
+def _get_background_pool() -> ThreadPoolExecutor:
+    """Return the module's pool for work that overlaps synthesis (e.g. MIDI parsing).
+
+    The pool is created on first use and shared by every synthesizer, so building
+    synthesizers per phrase or per test does not leave idle worker threads behind.
+    """
+    global _background_pool
+    with _background_pool_lock:
+        if _background_pool is None:
+            _background_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vox-dei")
+        return _background_pool
+
+
+def _as_f32(x: npt.NDArray) -> npt.NDArray[np.float32]:
+    """Return `x` as float32, without copying when it already is."""
+    return x if x.dtype == np.float32 else x.astype(np.float32)
+
+
+def _phase_vocoder(stft_matrix: npt.NDArray[np.complex64], time_steps: npt.NDArray[np.float64], hop_length: int) -> npt.NDArray[np.complex64]:
+    """Phase vocoder over arbitrary (fractional) frame positions, in one vectorised pass.
+
+    Equivalent to `librosa.phase_vocoder` for `time_steps = np.arange(0, n_frames, rate)`,
+    but any non-decreasing positions may be given (e.g. a variable stretch rate).
+    librosa advances the phase one output frame at a time in Python; here the
+    phase increments of all output frames are computed at once and accumulated
+    with a cumulative sum, in float32 like librosa.
+
+    Args:
+        stft_matrix (npt.NDArray[np.complex64]): STFT of shape (1 + n_fft // 2, n_frames).
+        time_steps (npt.NDArray[np.float64]): Input frame position of each output frame.
+        hop_length (int): Hop length of the STFT.
+
+    Returns:
+        npt.NDArray[np.complex64]: The resynthesised STFT, one frame per time step.
+    """
+    phi_advance = np.linspace(0.0, np.pi * hop_length, stft_matrix.shape[0], dtype=np.float32)[:, np.newaxis] # Expected phase advance per hop
+    padded = np.pad(stft_matrix, [(0, 0), (0, 2)])
+    magnitudes = np.abs(padded)
+    angles = np.angle(padded)
+    left = time_steps.astype(np.int64)
+    alpha = np.mod(time_steps, 1.0).astype(np.float32)
+
+    # Magnitude interpolated between the two neighbouring input frames
+    mag = magnitudes[:, left] * (1.0 - alpha)
+    mag += magnitudes[:, left + 1] * alpha
+
+    # Phase advance per output frame: expected advance plus the wrapped deviation
+    dphase = angles[:, left + 1] - angles[:, left]
+    dphase -= phi_advance
+    dphase -= np.float32(2.0 * np.pi) * np.round(dphase * np.float32(1.0 / (2.0 * np.pi)))
+    dphase += phi_advance
+    phase = np.cumsum(dphase, axis=1)
+    phase -= dphase # Exclusive prefix sum: frame t uses the advances of frames < t
+    phase += angles[:, :1]
+
+    stretched = np.empty(mag.shape, dtype=np.complex64)
+    np.multiply(mag, np.cos(phase), out=stretched.real)
+    np.multiply(mag, np.sin(phase), out=stretched.imag)
+    return stretched
+
+
+@njit(cache=True, fastmath=True)
+def _wsola_best_offset(padded: npt.NDArray[np.float32], continuation: int, lo: int, hi: int, overlap: int) -> int:
+    """Return the start in `lo..hi` whose `overlap` samples best match the continuation.
+
+    Candidates are ranked by cross-correlation with the continuation normalized by
+    the candidate's energy, so a louder but misaligned frame does not win over a
+    quieter matching one. The search is seeded from `lo` rather than `-inf`, which
+    fastmath code may assume never occurs.
+    """
+    best = lo
+    best_score = 0.0
+    for candidate in range(lo, hi + 1):
+        dot = 0.0
+        energy = 0.0
+        for i in range(overlap):
+            sample = padded[candidate + i]
+            dot += sample * padded[continuation + i]
+            energy += sample * sample
+        score = dot / (np.sqrt(energy) + 1e-8)
+        if candidate == lo or score > best_score:
+            best_score = score
+            best = candidate
+    return best
+
+
+@njit(cache=True, fastmath=True)
+def _wsola_stretch(x: npt.NDArray[np.float32], rate: float, frame_length: int, hop_length: int, search: int) -> npt.NDArray[np.float32]:
+    """Time stretch `x` by `rate` with WSOLA (waveform similarity overlap-add).
+
+    Output frames are taken every `hop_length` samples from around the nominal
+    input position `k * hop_length * rate`, shifted by up to `search` samples to
+    the offset whose overlap best correlates (normalized by energy) with the natural
+    continuation of the previous frame, and overlap-added with a Hann window. Compiled with numba.
+
+    Returns:
+        npt.NDArray[np.float32]: The stretched audio, `round(len(x) / rate)` samples long.
+    """
+    n_out = int(round(len(x) / rate))
+    window = np.empty(frame_length, dtype=np.float32)
+    for i in range(frame_length):
+        window[i] = 0.5 - 0.5 * np.cos(2.0 * np.pi * i / frame_length)
+    # Zero-padded so every candidate frame and continuation stays in bounds
+    padded = np.zeros(len(x) + 2 * search + 2 * frame_length, dtype=np.float32)
+    padded[search:search + len(x)] = x
+    out = np.zeros(n_out + frame_length, dtype=np.float32)
+    weight = np.zeros(n_out + frame_length, dtype=np.float32)
+    overlap = frame_length - hop_length
+    last_start = len(padded) - frame_length
+
+    previous = search # Padded start of the previous frame
+    for k in range(n_out // hop_length + 1):
+        nominal = min(search + int(k * hop_length * rate), last_start)
+        best = nominal
+        if k > 0:
+            best = _wsola_best_offset(padded, previous + hop_length, max(nominal - search, 0),
+                                      min(nominal + search, last_start), overlap)
+        offset = k * hop_length
+        for i in range(frame_length):
+            out[offset + i] += padded[best + i] * window[i]
+            weight[offset + i] += window[i]
+        previous = best
+
+    for i in range(n_out):
+        if weight[i] > 1e-3:
+            out[i] /= weight[i]
+    return out[:n_out]
+
+
 # --- Type Definitions ---
-class AlignedWord(TypedDict):
-    """Structure representing a word from pyfoal alignment."""
+@dataclass
+class AlignedWord:
+    """A word from pyfoal alignment, copied out of pyfoal's word objects once."""
+    __slots__ = ("start", "end", "text") # No per-instance dict; long texts have many words
     start: float
     end: float
     text: str
@@ -52,13 +225,16 @@ class VoxDeiSynthesizer:
     """Core vocal synthesis engine combining TTS and sample processing"""
 
     # --- Constants ---
-    _STRETCH_RATE_THRESHOLD: ClassVar[float] = 0.01 # Threshold for applying time stretch
+    _STRETCH_RATE_THRESHOLD: ClassVar[float] = 0.02 # Threshold for applying time stretch (a 2% change is inaudible in speech)
+    _RESAMPLE_STRETCH_THRESHOLD: ClassVar[float] = 0.1 # Below this rate deviation, words are resampled instead of vocoded
 
-    # Explicitly type internal buffers and the espeak engine instance
-    _tts_buffer: Optional[npt.NDArray[np.float32]]
-    _formant_buffer: Optional[npt.NDArray[np.float32]]
+    # Explicitly type the espeak engine instance
     espeak: Optional[TTSEngine]
     formant_shift_factor: float # Added type hint
+    _formant_params: FormantShiftParameters # Built once from formant_shift_factor
+    _last_params: Dict[ParameterEnum, int] # Last value applied to the engine per parameter
+    _use_gpu: bool # Contour pitch shifts via torchaudio (see _shift_spans_torch)
+    _use_wsola: bool # Duration-control word stretches via _wsola_stretch
 
     def __init__(self, config: "PsalmConfig", sample_rate: int = 48000): # Use string literal for type hint
         from ..config import PsalmConfig # Import locally for runtime use
@@ -72,12 +248,12 @@ class VoxDeiSynthesizer:
         self.sample_rate = sample_rate
         self.logger = logging.getLogger(__name__)
 
-        # Initialize internal buffers
-        self._tts_buffer = None
-        self._formant_buffer = None
+        self._use_gpu = self.config.use_gpu
+        self._use_wsola = self.config.use_wsola
 
         # Initialize TTS engine - explicitly None initially
         self.espeak = None
+        self._last_params = {}
         self.formant_shift_factor = 1.0 # Default value
 
         # Try espeak-ng first
@@ -97,33 +273,23 @@ class VoxDeiSynthesizer:
         if self.espeak:
             # Configure TTS engine based on settings
             # Use cast to inform type checker that self.espeak is not None here
+            # Each parameter is sent once, with its final value; the tempo-based rate
+            # is applied per synthesis call by `_update_espeak_parameters`.
             espeak_instance = cast(TTSEngine, self.espeak)
-            espeak_instance.set_parameter(ParameterEnum.RATE,
-                                    int(150 * self.config.tempo_scale))
-            espeak_instance.set_parameter(ParameterEnum.PITCH,
-                                    int(50 + self.config.vocal_timbre.choirboy * 30))
 
             # Apply articulation settings
             phoneme_rate = int(200 * self.config.robotic_articulation.phoneme_spacing)
-            espeak_instance.set_parameter(ParameterEnum.VOLUME,
-                                    int(100 * self.config.robotic_articulation.consonant_harshness)) # Corrected default volume
-            espeak_instance.set_parameter(ParameterEnum.RATE, phoneme_rate)
-
-            # Configure voice range
-            base_freqs = {
-                "C2": 65.41, "G2": 98.00,  # Bass
-                "A2": 110.00, "D3": 146.83,  # Baritone
-                "C3": 130.81, "G3": 196.00,  # Tenor
-                "E3": 164.81, "C4": 261.63   # Counter-tenor
-            }
+            volume = int(100 * self.config.robotic_articulation.consonant_harshness)
+            self._set_parameter(espeak_instance, ParameterEnum.VOLUME, volume) # Corrected default volume
+            self._set_parameter(espeak_instance, ParameterEnum.RATE, phoneme_rate)
 
-            # Get base frequency or default to C3
-            base_freq = base_freqs.get(self.config.voice_range.base_pitch, 130.81)
+            # Configure voice range: get base frequency or default to C3
+            base_freq = _BASE_FREQS.get(self.config.voice_range.base_pitch, _DEFAULT_BASE_FREQ)
 
             # Set pitch based on voice range with proper scaling
-            pitch_value = int(50 * (base_freq / 130.81)) # Assuming 50 is the baseline pitch for C3
+            pitch_value = int(50 * (base_freq / _DEFAULT_BASE_FREQ)) # Assuming 50 is the baseline pitch for C3
             self.logger.debug(f"Setting base pitch to {pitch_value}")
-            espeak_instance.set_parameter(ParameterEnum.PITCH, pitch_value)
+            self._set_parameter(espeak_instance, ParameterEnum.PITCH, pitch_value)
 
             # Apply formant shifting for voice character
             self.formant_shift_factor = self.config.voice_range.formant_shift
@@ -131,6 +297,9 @@ class VoxDeiSynthesizer:
              self.logger.error("No functional eSpeak engine could be initialized.")
              # Consider raising an error here if TTS is essential
 
+        # The formant factor is fixed from here on, so its parameters are validated once
+        self._formant_params = FormantShiftParameters(shift_factor=self.formant_shift_factor)
+
 
     def synthesize_text(self, text: str, midi_path: Optional[str] = None) -> tuple[npt.NDArray[np.float32], int]: # Reverted type hint
         """Synthesize text using TTS, optionally apply duration/melody, return audio.
@@ -143,7 +312,7 @@ class VoxDeiSynthesizer:
            segments using `librosa.effects.time_stretch` via the
            `_apply_duration_control` method.
         3. Apply melodic contour: Estimates the original pitch of audio segments
-           and shifts them to match the MIDI pitches using `librosa.effects.pitch_shift`
+           and shifts them to match the MIDI pitches using a phase vocoder (`librosa`)
            via the `_apply_melody_contour` method.
         Finally, applies configured formant shifting and atmospheric filters.
 
@@ -167,41 +336,34 @@ class VoxDeiSynthesizer:
         # Use cast to assure type checker self.espeak is not None
         espeak_instance = cast(TTSEngine, self.espeak)
 
+        # Start parsing the MIDI file in the background so it overlaps with TTS synthesis
+        midi_future: Optional["Future[List[Tuple[float, float]]]"] = None
+        if midi_path:
+            self.logger.info(f"MIDI path provided: {midi_path}. Attempting to parse melody.")
+            # Assuming default instrument index 0 for now
+            midi_future = _get_background_pool().submit(parse_midi_melody, midi_path, instrument_index=0)
+
         try:
             # Update parameters before synthesis
-            espeak_instance.set_parameter(ParameterEnum.RATE,
-                                    int(150 * self.config.tempo_scale))
-            espeak_instance.set_parameter(ParameterEnum.VOLUME,
-                                    int(100 * self.config.robotic_articulation.consonant_harshness))
+            self._update_espeak_parameters(espeak_instance)
 
             self.logger.debug("Synthesizing text with eSpeak...")
             # Call synth and unpack the audio data and sample rate
             audio_data, synth_sample_rate = espeak_instance.synth(text)
             # Rename audio_data to audio for consistency with the rest of the function
             audio: npt.NDArray[np.float32] = audio_data # Reverted type hint
-            # --- DEBUG: Save raw TTS output ---
-            if self.logger.isEnabledFor(logging.DEBUG):
-                import soundfile as sf # Import moved here
-                from pathlib import Path # Import moved here
-                try:
-                    raw_output_path = Path("debug_vocals_01_raw_tts.wav") # Numbered filename
-                    sf.write(raw_output_path, audio, synth_sample_rate)
-                    self.logger.debug(f"Saved raw TTS output to {raw_output_path}")
-                except Exception as write_err:
-                    self.logger.error(f"Failed to save raw TTS output: {write_err}")
-            # --- END DEBUG ---
+            self._dump(audio, synth_sample_rate, "01_raw_tts", "raw TTS output")
             if audio.size == 0: # Check size instead of len for numpy arrays
                 raise VoxDeiSynthesisError("TTS returned empty audio data")
 
-            self.logger.debug(f"Pre-processing max amplitude: {np.max(np.abs(audio))}")
+            if self.logger.isEnabledFor(logging.DEBUG): # Skip the full-array scan unless debugging
+                self.logger.debug(f"Pre-processing max amplitude: {max(float(audio.max()), -float(audio.min()))}")
 
-            # --- Parse MIDI once if path is provided ---
+            # --- Collect the MIDI melody parsed in the background ---
             parsed_melody_data: Optional[List[Tuple[float, float]]] = None
-            if midi_path:
-                self.logger.info(f"MIDI path provided: {midi_path}. Attempting to parse melody.")
+            if midi_future is not None:
                 try:
-                    # Assuming default instrument index 0 for now
-                    parsed_melody_data = parse_midi_melody(midi_path, instrument_index=0)
+                    parsed_melody_data = midi_future.result()
                     if not parsed_melody_data:
                          self.logger.warning(f"MIDI parsing resulted in an empty melody for path: {midi_path}")
                 except FileNotFoundError:
@@ -222,17 +384,7 @@ class VoxDeiSynthesizer:
                 self.logger.debug(f"Applying duration control based on parsed MIDI ({len(target_durations_sec)} target durations)...")
                 try:
                     audio = self._apply_duration_control(audio, synth_sample_rate, text, target_durations_sec)
-                    # --- DEBUG: Save audio after duration control ---
-                    if self.logger.isEnabledFor(logging.DEBUG):
-                        import soundfile as sf
-                        from pathlib import Path
-                        try:
-                            duration_path = Path("debug_vocals_01b_after_duration_control.wav")
-                            sf.write(duration_path, audio, synth_sample_rate)
-                            self.logger.debug(f"Saved audio after duration control to {duration_path}")
-                        except Exception as write_err:
-                            self.logger.error(f"Failed to save audio after duration control: {write_err}")
-                    # --- END DEBUG ---
+                    self._dump(audio, synth_sample_rate, "01b_after_duration_control", "audio after duration control")
                 except Exception as duration_err:
                      self.logger.exception(f"Error applying duration control: {duration_err}. Proceeding without duration control.")
             else:
@@ -240,45 +392,8 @@ class VoxDeiSynthesizer:
             # --- End Duration Control ---
 
 
-            # Apply formant shift and timbre blend
-            audio = self._apply_formant_shift(audio)
-            # --- DEBUG: Save audio after formant shift ---
-            if self.logger.isEnabledFor(logging.DEBUG):
-                import soundfile as sf # Import moved here
-                from pathlib import Path # Import moved here
-                try:
-                    formant_shift_path = Path("debug_vocals_02_after_formant_shift.wav")
-                    sf.write(formant_shift_path, audio, synth_sample_rate)
-                    self.logger.debug(f"Saved audio after formant shift to {formant_shift_path}")
-                except Exception as write_err:
-                    self.logger.error(f"Failed to save audio after formant shift: {write_err}")
-            # --- END DEBUG ---
-            # Apply atmospheric filters based on config (Bandpass takes precedence)
-            if self.config.bandpass_filter_params:
-                self.logger.debug("Applying bandpass filter...")
-                audio = apply_bandpass_filter(audio, self.sample_rate, params=self.config.bandpass_filter_params)
-            elif self.config.resonant_filter_params:
-                self.logger.debug("Applying resonant low-pass filter...")
-                audio = apply_rbj_lowpass_filter(audio, self.sample_rate, params=self.config.resonant_filter_params)
-            else:
-                self.logger.debug("No atmospheric filter configured.")
-
-            # --- DEBUG: Save audio after atmospheric filter ---
-            if self.logger.isEnabledFor(logging.DEBUG):
-                import soundfile as sf
-                from pathlib import Path
-                try:
-                    filter_path = Path("debug_vocals_03_after_filter.wav")
-                    sf.write(filter_path, audio, synth_sample_rate)
-                    self.logger.debug(f"Saved audio after atmospheric filter to {filter_path}")
-                except Exception as write_err:
-                    self.logger.error(f"Failed to save audio after atmospheric filter: {write_err}")
-            # --- END DEBUG ---
-
-            # Boost vocal output - ensure float32
-            audio = np.tanh(audio * 2.0).astype(np.float32)
-
-            self.logger.debug(f"Post-processing max amplitude: {np.max(np.abs(audio))}")
+            # Apply formant shift, atmospheric filter and output drive
+            audio = self._apply_voice_effects(audio, synth_sample_rate)
 
             # --- Apply Melody Contour from MIDI ---
             # Use the pre-parsed MIDI data
@@ -286,17 +401,7 @@ class VoxDeiSynthesizer:
                 self.logger.debug(f"Applying melody contour from parsed MIDI ({len(parsed_melody_data)} notes)...")
                 try:
                     audio = self._apply_melody_contour(audio, synth_sample_rate, parsed_melody_data)
-                    # --- DEBUG: Save audio after melody contour ---
-                    if self.logger.isEnabledFor(logging.DEBUG):
-                        import soundfile as sf
-                        from pathlib import Path
-                        try:
-                            contour_path = Path("debug_vocals_04_after_contour.wav")
-                            sf.write(contour_path, audio, synth_sample_rate)
-                            self.logger.debug(f"Saved audio after melody contour to {contour_path}")
-                        except Exception as write_err:
-                            self.logger.error(f"Failed to save audio after melody contour: {write_err}")
-                    # --- END DEBUG ---
+                    self._dump(audio, synth_sample_rate, "04_after_contour", "audio after melody contour")
                 except Exception as contour_err:
                      self.logger.exception(f"Error applying melody contour: {contour_err}. Proceeding without contour.")
             else:
@@ -310,41 +415,245 @@ class VoxDeiSynthesizer:
             self.logger.exception(f"TTS synthesis failed: {e}")
             raise VoxDeiSynthesisError(f"TTS synthesis failed: {str(e)}") from e
 
+    def _update_espeak_parameters(self, espeak_instance: TTSEngine) -> None:
+        """Push the configured RATE/VOLUME to the engine, skipping calls when unchanged."""
+        self._set_parameter(espeak_instance, ParameterEnum.RATE, int(150 * self.config.tempo_scale))
+        self._set_parameter(espeak_instance, ParameterEnum.VOLUME, int(100 * self.config.robotic_articulation.consonant_harshness))
+
+    def _set_parameter(self, espeak_instance: TTSEngine, param: ParameterEnum, value: int) -> None:
+        """Set an engine parameter unless it already holds `value` (tracked in `_last_params`)."""
+        if self._last_params.get(param) != value:
+            espeak_instance.set_parameter(param, value)
+            self._last_params[param] = value
+
+    def _apply_voice_effects(self, audio: npt.NDArray[np.float32], synth_sample_rate: int) -> npt.NDArray[np.float32]:
+        """Apply the fixed voice chain: formant shift, atmospheric filter and tanh drive.
+
+        Args:
+            audio (npt.NDArray[np.float32]): The synthesized (and optionally duration-controlled) audio.
+            synth_sample_rate (int): Sample rate of `audio`, used for debug output.
+
+        Returns:
+            npt.NDArray[np.float32]: The processed audio (a newly allocated array).
+        """
+        # Apply formant shift and timbre blend
+        audio = self._apply_formant_shift(audio)
+        self._dump(audio, synth_sample_rate, "02_after_formant_shift", "audio after formant shift")
+        # Apply atmospheric filters based on config (Bandpass takes precedence)
+        # A single causal pass (state initialised to the first sample) is used rather
+        # than zero-phase filtering: half the work, and no minimum input length.
+        if self.config.bandpass_filter_params:
+            self.logger.debug("Applying bandpass filter...")
+            audio = apply_bandpass_filter(audio, self.sample_rate, params=self.config.bandpass_filter_params, zero_phase=False)
+        elif self.config.resonant_filter_params:
+            self.logger.debug("Applying resonant low-pass filter...")
+            audio = apply_rbj_lowpass_filter(audio, self.sample_rate, params=self.config.resonant_filter_params, zero_phase=False)
+        else:
+            self.logger.debug("No atmospheric filter configured.")
+
+        self._dump(audio, synth_sample_rate, "03_after_filter", "audio after atmospheric filter")
+
+        # Boost vocal output - ensure float32
+        # The drive gain allocates the (caller-owned) float32 output and tanh runs
+        # in place on it; NumPy's float32 tanh is already a SIMD loop and measures
+        # faster than a clipped Pade or softsign approximation, so it stays exact.
+        audio = np.multiply(audio, np.float32(2.0), dtype=np.float32)
+        np.tanh(audio, out=audio)
+
+        if self.logger.isEnabledFor(logging.DEBUG): # Skip the full-array scan unless debugging
+            self.logger.debug(f"Post-processing max amplitude: {max(float(audio.max()), -float(audio.min()))}")
+
+        return audio
+
+    def synthesize_batch(self, texts: List[str], gap_sec: float = 0.25) -> Tuple[npt.NDArray[np.float32], int, List[Tuple[int, int]]]:
+        """Synthesize several texts and process them as a single buffer.
+
+        Each text is synthesized separately with the TTS engine, the results are
+        joined with `gap_sec` seconds of silence, and the formant shift, atmospheric
+        filter and output drive are then applied once to the joined audio instead
+        of once per text. Duration control and melodic contour are not applied.
+
+        Args:
+            texts (List[str]): The texts to synthesize, in order.
+            gap_sec (float): Silence inserted between consecutive texts, in seconds.
+                Defaults to 0.25.
+
+        Returns:
+            Tuple[npt.NDArray[np.float32], int, List[Tuple[int, int]]]: The processed
+                audio, its sample rate, and the (start, end) sample indices of each
+                text within the audio.
+
+        Raises:
+            VoxDeiSynthesisError: If no texts are given, the TTS engine is unavailable,
+                or synthesis fails.
+        """
+        if not texts:
+            raise VoxDeiSynthesisError("No texts provided for batch synthesis")
+        if not self.espeak:
+            raise VoxDeiSynthesisError("No TTS engine available for synthesis")
+
+        espeak_instance = cast(TTSEngine, self.espeak)
+
+        try:
+            self._update_espeak_parameters(espeak_instance)
+
+            pieces: List[npt.NDArray[np.float32]] = []
+            synth_sample_rate: Optional[int] = None
+            for i, text in enumerate(texts):
+                self.logger.debug(f"Synthesizing batch text {i+1}/{len(texts)} with eSpeak...")
+                audio_data, text_sample_rate = espeak_instance.synth(text)
+                if audio_data.size == 0:
+                    raise VoxDeiSynthesisError(f"TTS returned empty audio data for batch text {i+1}")
+                if synth_sample_rate is None:
+                    synth_sample_rate = text_sample_rate
+                elif text_sample_rate != synth_sample_rate:
+                    raise VoxDeiSynthesisError(
+                        f"TTS sample rate changed within batch ({text_sample_rate} Hz vs {synth_sample_rate} Hz)"
+                    )
+                pieces.append(audio_data)
+            sample_rate = cast(int, synth_sample_rate)
+
+            # Join the pieces with silence gaps, recording where each text lands
+            gap_samples = max(0, int(gap_sec * sample_rate))
+            total_samples = sum(len(piece) for piece in pieces) + gap_samples * (len(pieces) - 1)
+            audio = np.zeros(total_samples, dtype=np.float32)
+            boundaries: List[Tuple[int, int]] = []
+            position = 0
+            for piece in pieces:
+                audio[position:position + len(piece)] = piece
+                boundaries.append((position, position + len(piece)))
+                position += len(piece) + gap_samples
+
+            audio = self._apply_voice_effects(audio, sample_rate)
+            return audio, sample_rate, boundaries
+
+        except Exception as e:
+            self.logger.exception(f"Batch TTS synthesis failed: {e}")
+            raise VoxDeiSynthesisError(f"Batch TTS synthesis failed: {str(e)}") from e
+
+    def _dump(self, audio: npt.NDArray[np.float32], sample_rate: int, name: str, description: str) -> None:
+        """Save an intermediate stage to `debug_vocals_<name>.wav` when `_DEBUG_DUMP` is set.
+
+        Args:
+            audio (npt.NDArray[np.float32]): The audio at this stage.
+            sample_rate (int): Sample rate of `audio`.
+            name (str): Numbered stage name used in the filename (e.g. "01_raw_tts").
+            description (str): Human-readable stage description for the log messages.
+        """
+        if not _DEBUG_DUMP:
+            return
+        path = f"debug_vocals_{name}.wav"
+        try:
+            sf.write(path, audio, sample_rate)
+            self.logger.debug(f"Saved {description} to {path}")
+        except Exception as write_err:
+            self.logger.error(f"Failed to save {description}: {write_err}")
+
     def _apply_formant_shift(self, audio: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]: # Reverted type hint
-        """Apply robust formant shifting using the dedicated effects function."""
+        """Apply robust formant shifting using the dedicated effects function.
+
+        Float32 results are returned as-is; anything else is cast to a new float32 array.
+        """
         if abs(self.formant_shift_factor - 1.0) < 1e-6:
             # Skip shifting if factor is effectively 1.0
             return audio
 
         self.logger.debug(f"Applying robust formant shift with factor: {self.formant_shift_factor}")
-        params = FormantShiftParameters(shift_factor=self.formant_shift_factor)
+        params = self._formant_params
+        if params.shift_factor != self.formant_shift_factor: # Factor reassigned after __init__
+            params = self._formant_params = FormantShiftParameters(shift_factor=self.formant_shift_factor)
         try:
             # Pass sample_rate explicitly
             shifted_audio = apply_robust_formant_shift(audio, self.sample_rate, params=params)
-            # Ensure output is float32
-            return shifted_audio.astype(np.float32) # Ensure float32 output
+            # Ensure output is float32 (no copy needed if it already is)
+            return _as_f32(shifted_audio)
         except Exception as e:
             self.logger.error(f"Robust formant shifting failed: {e}", exc_info=True)
             # Return original audio on error to avoid breaking the chain
-            return audio.astype(np.float32) # Ensure float32 output on error
+            return np.asarray(audio, dtype=np.float32) # Ensure float32 output on error (no copy if already float32)
+
+    def _estimate_f0(self, audio: npt.NDArray[np.float32], sample_rate: int) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        """Estimate a frame-wise F0 track for the whole audio.
+
+        Frames are spaced `_PYIN_HOP_LENGTH` samples apart (at `sample_rate`) and
+        centred on multiples of the hop, whichever backend is used. Audio above
+        `_PITCH_SR` is downsampled to that rate for the estimate only, which cuts
+        the analysis cost without affecting the F0 range of interest. The backend
+        is selected by `_F0_BACKEND`: "pyworld" runs DIO + StoneMask (native C,
+        much faster than pyin's Viterbi decoding), "pyin" uses `librosa.pyin`. If
+        pyworld fails, pyin is used as a fallback.
+
+        Args:
+            audio (npt.NDArray[np.float32]): The input audio waveform.
+            sample_rate (int): The sample rate of the audio.
 
-    def _apply_melody_contour(self, audio: npt.NDArray[np.float32], sample_rate: int, melody: List[Tuple[float, float]]) -> npt.NDArray[np.float32]: # Reverted type hint
+        Returns:
+            Tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]: The F0 per frame in Hz
+                (NaN or 0 where unvoiced) and the voiced flag per frame.
+        """
+        if sample_rate > _PITCH_SR:
+            pitch_audio = librosa.resample(_as_f32(audio), orig_sr=sample_rate, target_sr=_PITCH_SR)
+            pitch_sr = _PITCH_SR
+        else:
+            pitch_audio = _as_f32(audio)
+            pitch_sr = sample_rate
+        frame_period_ms = 1000.0 * _PYIN_HOP_LENGTH / sample_rate
+
+        if _F0_BACKEND == "pyworld":
+            try:
+                x = pitch_audio.astype(np.float64) # pyworld requires float64
+                # DIO frames are placed by time, so the hop is unchanged by resampling
+                f0, t = pw.dio(x, pitch_sr, f0_floor=_FMIN_HZ, f0_ceil=_FMAX_HZ, frame_period=frame_period_ms)
+                f0 = pw.stonemask(x, f0, t, pitch_sr)
+                return f0, f0 > 0
+            except Exception as pw_err:
+                self.logger.warning(f"pyworld F0 estimation failed ({pw_err}), falling back to pyin.")
+
+        if pitch_sr == sample_rate:
+            f0, voiced_flag, _ = librosa.pyin(pitch_audio,
+                                              fmin=_FMIN_HZ,
+                                              fmax=_FMAX_HZ,
+                                              sr=sample_rate,
+                                              frame_length=_PYIN_FRAME_LENGTH,
+                                              hop_length=_PYIN_HOP_LENGTH)
+            return f0, voiced_flag
+
+        # The hop rarely maps to a whole number of samples at _PITCH_SR, so the
+        # track is estimated on the nearest hop and interpolated onto the frame grid.
+        pitch_hop = max(1, round(_PYIN_HOP_LENGTH * pitch_sr / sample_rate))
+        f0, voiced_flag, _ = librosa.pyin(pitch_audio,
+                                          fmin=_FMIN_HZ,
+                                          fmax=_FMAX_HZ,
+                                          sr=pitch_sr,
+                                          frame_length=_PITCH_FRAME_LENGTH,
+                                          hop_length=pitch_hop)
+        n_frames = 1 + len(audio) // _PYIN_HOP_LENGTH
+        frame_scale = (_PYIN_HOP_LENGTH / sample_rate) / (pitch_hop / pitch_sr)
+        nearest = np.minimum(np.rint(np.arange(n_frames) * frame_scale).astype(np.int64), len(f0) - 1)
+        return f0[nearest], voiced_flag[nearest]
+
+    def _apply_melody_contour(self, audio: npt.NDArray[np.float32], sample_rate: int, melody: typing.Union[List[Tuple[float, float]], npt.NDArray[np.float64]]) -> npt.NDArray[np.float32]: # Reverted type hint
         """Apply a target melodic contour to the synthesized audio using pitch shifting.
 
         This method iterates through the provided `melody` (a list of pitch/duration tuples).
         For each target segment in the melody:
         1. It extracts the corresponding segment from the input `audio`.
-        2. It estimates the original fundamental frequency (F0) of the audio segment using
-           `librosa.pyin`. Handles segments too short for reliable estimation.
-        3. It calculates the required pitch shift in semitones to match the target pitch.
-        4. It applies the pitch shift using `librosa.effects.pitch_shift`.
-        5. Segments are concatenated, and the final audio is adjusted to match the original length.
+        2. It estimates the original fundamental frequency (F0) of the audio segment from a
+           single F0 pass over the whole audio (see `_estimate_f0`), averaging the voiced
+           frames that fall inside the segment. Handles segments too short for reliable estimation.
+        3. It calculates the required pitch shift in semitones to match the target pitch,
+           quantised to `_SHIFT_QUANTUM_SEMITONES`.
+        4. It applies each distinct shift once, over the span of audio covering every
+           segment that needs it, with a phase vocoder working on slices of a single
+           STFT of the whole audio (see `_shift_span`).
+        5. Segments are written into a preallocated output of the original length.
 
         Args:
             audio (npt.NDArray[np.float32]): The input audio waveform.
             sample_rate (int): The sample rate of the audio.
-            melody (List[Tuple[float, float]]): The target melodic contour, where each
-                tuple is (pitch_in_hz, duration_in_seconds).
+            melody (Union[List[Tuple[float, float]], npt.NDArray[np.float64]]): The target
+                melodic contour, where each tuple (or row of an (N, 2) array) is
+                (pitch_in_hz, duration_in_seconds).
 
         Returns:
             npt.NDArray[np.float32]: The audio waveform with the melodic contour applied.
@@ -353,143 +662,279 @@ class VoxDeiSynthesizer:
         # librosa import moved to top
 
         self.logger.debug(f"Applying melody contour with {len(melody)} segments to audio of length {len(audio)}.")
-        processed_segments = []
-        current_sample = 0
+        # Normalise once here (a no-op for eSpeak's float32 output); slices taken below are
+        # then float32 views and need no further casts.
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        # (pitch_hz, duration_sec) rows; converted once so the columns are used as arrays below
+        melody_array = np.asarray(melody, dtype=np.float64).reshape(-1, 2)
         total_samples = len(audio) # Original audio length
 
-        for i, (target_pitch_hz, duration_sec) in enumerate(melody):
-            start_sample = current_sample # Start sample index for this segment
-            # Calculate end sample, ensuring it doesn't exceed total audio length
-            end_sample = min(start_sample + int(duration_sec * sample_rate), total_samples)
-            segment_len_samples = end_sample - start_sample # Actual length of this segment
-
-            # Skip processing if segment length is zero or negative
-            if segment_len_samples <= 0:
-                self.logger.warning(f"Skipping zero/negative length melody segment {i+1}/{len(melody)}.")
+        # --- Segment Boundaries ---
+        # Consecutive segments, each int(duration * sr) samples long (negative durations
+        # contribute nothing), clipped to the audio length.
+        segment_lengths = np.maximum((melody_array[:, 1] * sample_rate).astype(np.int64), 0)
+        segment_ends = np.minimum(np.cumsum(segment_lengths), total_samples)
+        segment_starts = np.concatenate(([0], segment_ends))[:-1]
+        melody_end_sample = int(segment_ends[-1]) if len(segment_ends) else 0
+
+        # Status that depends only on the segment lengths
+        target_pitches_all = melody_array[:, 0]
+        clipped_lengths = segment_ends - segment_starts # Actual segment lengths within the audio
+        in_audio = segment_starts < total_samples # Segments past the end of the audio are ignored
+        empty_segments = in_audio & (clipped_lengths <= 0)
+        processed = in_audio & ~empty_segments
+        too_short = processed & (clipped_lengths < int(_MIN_PYIN_DURATION_SEC * sample_rate))
+
+        # --- Pitch Estimation (single pass) ---
+        # Estimate F0 once over the full audio rather than once per segment; each
+        # segment then averages the frames it covers. When no segment is long enough
+        # to be estimated, every segment keeps its target pitch and F0 is never needed.
+        f0_all: Optional[npt.NDArray[np.float64]] = None
+        voiced_flag_all: Optional[npt.NDArray[np.bool_]] = None
+        if np.any(processed & ~too_short):
+            try:
+                with scipy.fft.set_workers(_FFT_WORKERS): # librosa's FFTs go through scipy.fft
+                    f0_all, voiced_flag_all = self._estimate_f0(audio, sample_rate)
+            except Exception as f0_err:
+                self.logger.error(f"Error during pitch estimation: {f0_err}. Skipping pitch shifts.")
+
+        # Mean F0 over the voiced, non-NaN frames of every segment, from prefix sums
+        # over the frame track. Frames are centred on multiples of the hop length.
+        segment_f0_means: Optional[npt.NDArray[np.float64]] = None
+        if f0_all is not None and voiced_flag_all is not None:
+            usable_frames = np.asarray(voiced_flag_all, dtype=bool) & ~np.isnan(f0_all)
+            f0_sums = np.concatenate(([0.0], np.cumsum(np.where(usable_frames, f0_all, 0.0))))
+            f0_counts = np.concatenate(([0], np.cumsum(usable_frames)))
+            first_frames = np.minimum(segment_starts // _PYIN_HOP_LENGTH, len(f0_all))
+            last_frames = np.minimum(np.maximum(first_frames + 1, segment_ends // _PYIN_HOP_LENGTH), len(f0_all))
+            frame_counts = f0_counts[last_frames] - f0_counts[first_frames]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                segment_f0_means = np.where(frame_counts > 0, (f0_sums[last_frames] - f0_sums[first_frames]) / frame_counts, np.nan)
+
+        # --- Segment Status ---
+        # Each segment's original pitch is its voiced F0 mean; segments that are empty,
+        # too short for reliable estimation, or unvoiced fall back to their target
+        # pitch (i.e. no shift). The status masks drive the warnings below.
+        if segment_f0_means is not None:
+            unvoiced = processed & ~too_short & np.isnan(segment_f0_means)
+            estimated = processed & ~too_short & ~unvoiced
+            original_pitches_all = np.where(estimated, segment_f0_means, target_pitches_all)
+        else:
+            # F0 estimation failed (already logged) or was not needed: no shifts
+            unvoiced = np.zeros(len(melody), dtype=bool)
+            original_pitches_all = target_pitches_all
+
+        for i in np.flatnonzero(empty_segments).tolist():
+            self.logger.warning("Skipping zero/negative length melody segment %d/%d.", i + 1, len(melody))
+        for i in np.flatnonzero(too_short).tolist():
+            self.logger.warning("Segment %d/%d too short (%.3fs < %ss) for pyin pitch estimation, skipping shift.",
+                                i + 1, len(melody), clipped_lengths[i] / sample_rate, _MIN_PYIN_DURATION_SEC)
+        for i in np.flatnonzero(unvoiced).tolist():
+            self.logger.warning("Segment %d/%d: No voiced frames detected or all NaNs in F0 estimate, using target pitch (%.2f Hz) as original.",
+                                i + 1, len(melody), target_pitches_all[i])
+
+        # --- Pitch Shift Calculation ---
+        # Semitone shifts for all processed segments in one vectorised pass; invalid
+        # pitches (<= 0, or a non-finite ratio) get no shift.
+        segment_indices = np.flatnonzero(processed)
+        target_pitches = target_pitches_all[segment_indices]
+        original_pitches = original_pitches_all[segment_indices]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            semitone_shifts = 12.0 * np.log2(target_pitches / original_pitches)
+        valid_pitches = (original_pitches > 0) & (target_pitches > 0) & np.isfinite(semitone_shifts)
+        semitone_shifts = np.where(valid_pitches, semitone_shifts, 0.0)
+        # Shifts are quantised so segments asking for (nearly) the same shift can
+        # share a single pitch_shift pass below.
+        shift_keys = np.round(semitone_shifts / _SHIFT_QUANTUM_SEMITONES) * _SHIFT_QUANTUM_SEMITONES
+        shift_keys = np.where(np.abs(semitone_shifts) > _MIN_SEMITONE_SHIFT, shift_keys, 0.0)
+
+        for j in np.flatnonzero(~valid_pitches).tolist():
+            self.logger.warning("Segment %d/%d: Invalid original (%.2f Hz) or target (%.2f Hz) pitch, skipping shift.",
+                                segment_indices[j] + 1, len(melody), original_pitches[j], target_pitches[j])
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for i, original_pitch_hz, target_pitch_hz, semitone_shift, shift_key in zip(
+                    segment_indices.tolist(), original_pitches.tolist(), target_pitches.tolist(), semitone_shifts.tolist(), shift_keys.tolist()):
+                if shift_key != 0.0:
+                    self.logger.debug("Segment %d/%d: Original ~%.2f Hz, Target %.2f Hz -> Shifting %.2f semitones.",
+                                      i + 1, len(melody), original_pitch_hz, target_pitch_hz, shift_key)
+                else:
+                    self.logger.debug("Segment %d/%d: No significant pitch shift needed (%.2f semitones).",
+                                      i + 1, len(melody), semitone_shift)
+
+        # --- Pitch Shift Planning ---
+        # (start_sample, end_sample, quantised semitone shift) per processed segment
+        shift_plan: List[Tuple[int, int, float]] = list(zip(segment_starts[segment_indices].tolist(), segment_ends[segment_indices].tolist(), shift_keys.tolist()))
+
+        # --- Pitch Shift Application ---
+        # Runs of consecutive segments with the same (quantised) shift are shifted in
+        # one pass over the span they cover; the segments are then sliced from that
+        # result. Shifting preserves length, so span offsets map directly onto the
+        # output. The forward STFT is computed once and shared by every span; the
+        # spans are independent and librosa's FFT work releases the GIL, so several
+        # shifts are processed concurrently.
+        shift_tasks: List[Tuple[float, int, int]] = [] # (shift, span_start, span_end)
+        plan_tasks: List[int] = [] # Index into shift_tasks per shift_plan entry, -1 if unshifted
+        for start_sample, end_sample, shift_key in shift_plan:
+            if shift_key == 0.0:
+                plan_tasks.append(-1)
                 continue
+            if shift_tasks and shift_tasks[-1][0] == shift_key and shift_tasks[-1][2] == start_sample:
+                shift_tasks[-1] = (shift_key, shift_tasks[-1][1], end_sample) # Extend the current run
+            else:
+                shift_tasks.append((shift_key, start_sample, end_sample))
+            plan_tasks.append(len(shift_tasks) - 1)
 
-            segment = audio[start_sample:end_sample]
-
-            # --- Pitch Estimation ---
-            # Estimate original pitch of the segment using pyin.
-            # pyin requires a minimum duration; handle short segments gracefully.
-            min_pyin_duration_samples = int(_MIN_PYIN_DURATION_SEC * sample_rate)
-            original_pitch_hz = target_pitch_hz # Default/fallback if estimation fails or segment is too short
-            semitone_shift = 0.0 # Default shift if estimation fails or target==original
+        if not shift_tasks:
+            # Every segment is already within _MIN_SEMITONE_SHIFT of its target (or skipped)
+            self.logger.debug("No segment needs a pitch shift, returning the audio unchanged.")
+            return audio
 
-            if segment_len_samples < min_pyin_duration_samples:
-                self.logger.warning(f"Segment {i+1}/{len(melody)} too short ({segment_len_samples / sample_rate:.3f}s < {_MIN_PYIN_DURATION_SEC}s) for pyin pitch estimation, skipping shift.")
-                # Keep default original_pitch_hz = target_pitch_hz and semitone_shift = 0.0
+        # shift_tasks is non-empty from here; a None GPU result falls back to the CPU vocoder
+        gpu_results = self._shift_spans_torch(audio, sample_rate, shift_tasks) if self._use_gpu else None
+        shift_results: List[Optional[npt.NDArray[np.float32]]] = [None] * len(shift_tasks)
+        stft_matrix: Optional[npt.NDArray[np.complex64]] = None
+        if gpu_results is not None:
+            shift_results = gpu_results
+        else:
+            try:
+                # Zero-padded by one FFT so the last span has whole frames past its end
+                with scipy.fft.set_workers(_FFT_WORKERS):
+                    stft_matrix = librosa.stft(np.pad(audio, (0, _VOCODER_N_FFT)),
+                                               n_fft=_VOCODER_N_FFT, hop_length=_VOCODER_HOP_LENGTH)
+            except Exception as stft_err:
+                self.logger.error(f"Error computing STFT for pitch shifting: {stft_err}. Skipping pitch shifts.", exc_info=True)
+
+        if stft_matrix is not None:
+            if len(shift_tasks) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(shift_tasks), os.cpu_count() or 1)) as executor:
+                    shift_results = list(executor.map(lambda task: self._shift_span(stft_matrix, sample_rate, *task), shift_tasks))
             else:
-                # Attempt pyin pitch estimation
-                try:
-                    f0, voiced_flag, voiced_probs = librosa.pyin(segment.astype(np.float32), # Ensure float32 for pyin
-                                                                 fmin=float(librosa.note_to_hz('C2')),
-                                                                 fmax=float(librosa.note_to_hz('C7')),
-                                                                 sr=sample_rate,
-                                                                 frame_length=2048, # Default, adjust if needed
-                                                                 hop_length=512) # Default, adjust if needed
-                    # Calculate average pitch of voiced frames, ignoring NaNs
-                    voiced_f0 = f0[voiced_flag]
-                    if np.any(voiced_flag) and not np.all(np.isnan(voiced_f0)):
-                        original_pitch_hz = np.nanmean(voiced_f0)
-                    else:
-                        self.logger.warning(f"Segment {i+1}/{len(melody)}: No voiced frames detected or all NaNs in pyin output, using target pitch ({target_pitch_hz:.2f} Hz) as original.")
-                        # Keep default original_pitch_hz = target_pitch_hz
-                except Exception as pyin_err:
-                    self.logger.error(f"Error during pyin pitch estimation for segment {i+1}/{len(melody)}: {pyin_err}. Skipping shift.")
-                    # Keep default original_pitch_hz = target_pitch_hz and semitone_shift = 0.0
-
-            # --- Pitch Shift Calculation ---
-            # Calculate pitch shift in semitones, handling potential invalid pitch values.
-            if original_pitch_hz > 0 and target_pitch_hz > 0:
-                # Avoid log2(0) or division by zero if pitches are valid
-                try:
-                    semitone_shift = 12 * np.log2(target_pitch_hz / original_pitch_hz)
-                except (ValueError, ZeroDivisionError) as calc_err:
-                    self.logger.warning(f"Segment {i+1}/{len(melody)}: Error calculating semitone shift ({calc_err}). Original: {original_pitch_hz:.2f}, Target: {target_pitch_hz:.2f}. Skipping shift.")
-                    semitone_shift = 0.0
+                # A single span gets the FFT threads instead of a worker pool
+                with scipy.fft.set_workers(_FFT_WORKERS):
+                    shift_results = [self._shift_span(stft_matrix, sample_rate, *task) for task in shift_tasks]
+
+        # --- Output Assembly ---
+        # Segments are contiguous from sample 0, and the unshifted tail covers the rest,
+        # so every sample of the preallocated output is written at most once. The
+        # output starts zeroed and copies are clipped to the shifted span, so a span
+        # that comes back short is zero-padded in place rather than resized afterwards.
+        final_audio = np.zeros(total_samples, dtype=np.float32)
+        for (start_sample, end_sample, _), task_index in zip(shift_plan, plan_tasks):
+            shifted_span = shift_results[task_index] if task_index >= 0 else None
+            if shifted_span is not None:
+                span_start = shift_tasks[task_index][1]
+                piece = shifted_span[start_sample - span_start:end_sample - span_start]
+                final_audio[start_sample:start_sample + len(piece)] = piece
             else:
-                # Log warning if either pitch is invalid (<= 0) and ensure no shift happens
-                self.logger.warning(f"Segment {i+1}/{len(melody)}: Invalid original ({original_pitch_hz:.2f} Hz) or target ({target_pitch_hz:.2f} Hz) pitch, skipping shift.")
-                semitone_shift = 0.0
+                final_audio[start_sample:end_sample] = audio[start_sample:end_sample] # Original if unshifted or on error
 
-            # --- Pitch Shift Application ---
-            # Apply pitch shift using librosa if the shift is significant.
-            if abs(semitone_shift) > _MIN_SEMITONE_SHIFT:
-                try:
-                    self.logger.debug(f"Segment {i+1}/{len(melody)}: Original ~{original_pitch_hz:.2f} Hz, Target {target_pitch_hz:.2f} Hz -> Shifting {semitone_shift:.2f} semitones.")
-                    # Ensure input to pitch_shift is float32
-                    segment_float32 = segment.astype(np.float32)
-                    shifted_segment = librosa.effects.pitch_shift(y=segment_float32,
-                                                                  sr=sample_rate,
-                                                                  n_steps=semitone_shift)
-                    processed_segments.append(shifted_segment)
-                except Exception as e:
-                    self.logger.error(f"Error pitch shifting segment {i+1}/{len(melody)}: {e}. Using original segment.", exc_info=True)
-                    processed_segments.append(segment.astype(np.float32)) # Append original on error, ensure float32
-            else:
-                self.logger.debug(f"Segment {i+1}/{len(melody)}: No significant pitch shift needed ({semitone_shift:.2f} semitones).")
-                processed_segments.append(segment.astype(np.float32)) # Append original if no shift needed, ensure float32
+        # Handle any remaining audio if the melody duration was shorter than the audio.
+        if melody_end_sample < total_samples:
+            remaining_samples = total_samples - melody_end_sample
+            self.logger.debug(f"Melody duration shorter than audio. Keeping remaining {remaining_samples} samples ({remaining_samples/sample_rate:.3f}s) unchanged.")
+            final_audio[melody_end_sample:] = audio[melody_end_sample:]
 
-            current_sample = end_sample # Move to the start of the next segment
-            # Exit loop if we've processed the entire audio array
-            if current_sample >= total_samples:
-                break # Correctly indented break statement
+        return final_audio
 
-        # --- Final Concatenation & Length Adjustment ---
-        # Handle any remaining audio if the melody duration was shorter than the audio.
-        if current_sample < total_samples:
-            remaining_samples = total_samples - current_sample
-            self.logger.debug(f"Melody duration shorter than audio. Appending remaining {remaining_samples} samples ({remaining_samples/sample_rate:.3f}s) unchanged.")
-            processed_segments.append(audio[current_sample:].astype(np.float32)) # Ensure float32
 
-        # Concatenate processed segments.
-        if not processed_segments:
-             # This should ideally not happen if input audio is non-empty, but handle defensively.
-             self.logger.warning("No segments were processed or collected for melody contour. Returning original audio.")
-             return audio.astype(np.float32) # Ensure float32 return
 
-        try:
-            final_audio = np.concatenate(processed_segments)
-        except ValueError as concat_err:
-             self.logger.error(f"Error concatenating processed segments: {concat_err}. Returning original audio.", exc_info=True)
-             return audio.astype(np.float32) # Ensure float32 return
+    def _shift_span(self, stft_matrix: npt.NDArray[np.complex64], sample_rate: int, shift_key: float, span_start: int, span_end: int) -> Optional[npt.NDArray[np.float32]]:
+        """Pitch shift the audio in `[span_start, span_end)` by `shift_key` semitones.
 
-        # Ensure final audio length matches original, as pitch shifting might cause minor length changes.
-        if len(final_audio) != total_samples:
-             self.logger.warning(f"Melody processed audio length ({len(final_audio)}) differs from original ({total_samples}). Adjusting length by padding/truncating.")
-             if len(final_audio) > total_samples:
-                 # Truncate if too long
-                 final_audio = final_audio[:total_samples]
-             else:
-                 # Pad with zeros if too short
-                 padding = np.zeros(total_samples - len(final_audio), dtype=np.float32)
-                 final_audio = np.concatenate([final_audio, padding])
+        This is `librosa.effects.pitch_shift` (phase-vocoder time stretch, then
+        resampling back to the original duration) working on a slice of the
+        shared STFT of the whole audio instead of a fresh STFT of the span, with
+        the vectorised `_phase_vocoder`. A few frames either side of the span are
+        vocoded with it and trimmed afterwards.
 
-        return final_audio.astype(np.float32) # Ensure float32 return
+        Args:
+            stft_matrix (npt.NDArray[np.complex64]): STFT of the whole audio
+                (`_VOCODER_N_FFT`, `_VOCODER_HOP_LENGTH`, centred frames).
+            sample_rate (int): The sample rate of the audio.
+            shift_key (float): The shift in semitones.
+            span_start (int): First sample of the span.
+            span_end (int): End sample (exclusive) of the span.
 
+        Returns:
+            Optional[npt.NDArray[np.float32]]: The shifted span, or None if shifting failed (logged).
+        """
+        try:
+            rate = 2.0 ** (-shift_key / 12.0) # Time-stretch rate; resampling then restores the duration
+            first_frame = max(0, span_start // _VOCODER_HOP_LENGTH - _VOCODER_MARGIN_FRAMES)
+            last_frame = min(stft_matrix.shape[1], -(-span_end // _VOCODER_HOP_LENGTH) + 1 + _VOCODER_MARGIN_FRAMES)
+            block_length = (last_frame - first_frame - 1) * _VOCODER_HOP_LENGTH # Samples between the outer frame centres
+
+            stretched = _phase_vocoder(stft_matrix[:, first_frame:last_frame],
+                                       np.arange(0, last_frame - first_frame, rate, dtype=np.float64),
+                                       _VOCODER_HOP_LENGTH)
+            block = librosa.istft(stretched, hop_length=_VOCODER_HOP_LENGTH, n_fft=_VOCODER_N_FFT,
+                                  length=int(round(block_length / rate)), dtype=np.float32)
+            # librosa's default soxr resampler takes the irrational ratio directly and is
+            # as fast as a rational resample_poly approximation of it
+            block = librosa.resample(block, orig_sr=sample_rate / rate, target_sr=sample_rate)
+
+            offset = span_start - first_frame * _VOCODER_HOP_LENGTH # Block sample 0 is frame `first_frame`'s centre
+            return _as_f32(block[offset:offset + span_end - span_start])
+        except Exception as e:
+            self.logger.error(f"Error pitch shifting by {shift_key:.2f} semitones: {e}. Using original segments.", exc_info=True)
+            return None
 
+    def _shift_spans_torch(self, audio: npt.NDArray[np.float32], sample_rate: int, shift_tasks: List[Tuple[float, int, int]]) -> Optional[List[Optional[npt.NDArray[np.float32]]]]:
+        """Pitch shift each (shift, span_start, span_end) task with torchaudio.
 
-    def _perform_alignment(self, audio: npt.NDArray[np.float32], sample_rate: int, text: str) -> Optional[List[AlignedWord]]:
+        Used when `config.use_gpu` is set. The spans run on CUDA when a device is
+        available, otherwise on the CPU. torch and torchaudio are optional and
+        imported here; if either is missing, or the transform fails, the error is
+        logged and None is returned so the caller falls back to librosa.
+
+        Returns:
+            Optional[List[Optional[npt.NDArray[np.float32]]]]: One shifted span per task,
+                or None if torchaudio could not be used.
+        """
+        try:
+            import torch
+            import torchaudio
+
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            results: List[Optional[npt.NDArray[np.float32]]] = []
+            with torch.inference_mode():
+                for shift_key, span_start, span_end in shift_tasks:
+                    transform = torchaudio.transforms.PitchShift(sample_rate, n_steps=shift_key).to(device)
+                    span = torch.from_numpy(np.ascontiguousarray(audio[span_start:span_end], dtype=np.float32)).to(device)
+                    results.append(transform(span).cpu().numpy())
+            return results
+        except Exception as e:
+            self.logger.warning(f"torchaudio pitch shifting unavailable ({e}), falling back to librosa.")
+            return None
+
+    def _perform_alignment(self, audio: npt.NDArray[np.float32], sample_rate: int, text: str, cache: bool = True) -> Optional[List[AlignedWord]]:
         """Performs forced alignment using pyfoal.
 
         Uses the `pyfoal.align` function to generate word-level timestamps for
-        the input audio and text.
+        the input audio and text. With `cache`, successful alignments are stored
+        under `_ALIGNMENT_CACHE_DIR`, keyed by hashes of the audio (and sample rate)
+        and of the text, and re-running the same pair skips pyfoal.
 
         Args:
             audio (npt.NDArray[np.float32]): The input audio waveform.
             sample_rate (int): The sample rate of the audio.
             text (str): The text corresponding to the audio.
+            cache (bool): Read and write the on-disk alignment cache. Defaults to True.
 
         Returns:
             Optional[List[AlignedWord]]: A list of aligned word objects, each
-                containing 'start', 'end', and 'text', or None if alignment fails
+                with float start/end times (seconds) and text, or None if alignment fails
                 or returns no words.
 
         Raises:
             Exception: Can propagate exceptions from `pyfoal.align`.
         """
+        cache_path = self._alignment_cache_path(audio, sample_rate, text) if cache else None
+        if cache_path is not None:
+            cached_words = self._load_cached_alignment(cache_path)
+            if cached_words is not None:
+                return cached_words
+
         try:
             self.logger.debug("Performing forced alignment with pyfoal...")
             # Assuming pyfoal.align returns an object with a .words attribute
@@ -500,18 +945,22 @@ class VoxDeiSynthesizer:
                 self.logger.warning("pyfoal alignment returned no result. Skipping duration control.")
                 return None
 
-            # Access the .words attribute/method and cast to the expected type
+            # Access the .words attribute/method and convert to AlignedWord
             try:
-                # Try accessing as a method first, then attribute, and cast
+                # Try accessing as a method first, then attribute
                 words_data = alignment_result.words
                 if callable(words_data):
                     words_data = words_data() # Call if it's a function
 
-                aligned_words_list = cast(List[AlignedWord], words_data)
-                if not aligned_words_list:
-                    self.logger.warning("pyfoal alignment result's .words is empty or cast failed. Skipping duration control.")
+                if not words_data:
+                    self.logger.warning("pyfoal alignment result's .words is empty. Skipping duration control.")
                     return None
+                # Attribute access works for pyfoal words and test mocks alike
+                aligned_words_list = [AlignedWord(float(word.start), float(word.end), str(getattr(word, 'text', 'UNKNOWN')))
+                                      for word in words_data]
                 self.logger.debug(f"Alignment successful, found {len(aligned_words_list)} words.")
+                if cache_path is not None:
+                    self._store_alignment(cache_path, aligned_words_list)
                 return aligned_words_list
             except AttributeError:
                 self.logger.error("pyfoal alignment result does not have a '.words' attribute. Skipping duration control.", exc_info=True)
@@ -524,6 +973,38 @@ class VoxDeiSynthesizer:
             self.logger.error(f"pyfoal alignment failed: {align_err}. Skipping duration control.", exc_info=True)
             return None
 
+    @staticmethod
+    def _alignment_cache_path(audio: npt.NDArray[np.float32], sample_rate: int, text: str) -> str:
+        """Cache file for the alignment of `audio` (at `sample_rate`) against `text`."""
+        audio_hash = hashlib.blake2b(np.ascontiguousarray(audio).tobytes(), digest_size=8)
+        audio_hash.update(f"{audio.dtype}:{sample_rate}".encode())
+        text_hash = hashlib.blake2b(text.encode(), digest_size=8)
+        return os.path.join(_ALIGNMENT_CACHE_DIR, f"{audio_hash.hexdigest()}_{text_hash.hexdigest()}.json")
+
+    def _load_cached_alignment(self, cache_path: str) -> Optional[List[AlignedWord]]:
+        """Load a cached alignment, or None if there is none or it cannot be read."""
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                words = [AlignedWord(float(start), float(end), str(word_text))
+                         for start, end, word_text in json.load(f)]
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable alignment cache '{cache_path}': {e}")
+            return None
+        self.logger.debug(f"Loaded cached alignment ({len(words)} words) from {cache_path}.")
+        return words if words else None
+
+    def _store_alignment(self, cache_path: str, aligned_words_list: List[AlignedWord]) -> None:
+        """Write an alignment to the cache; failures are logged and otherwise ignored."""
+        try:
+            rows = [(word.start, word.end, word.text) for word in aligned_words_list]
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+        except Exception as e:
+            self.logger.warning(f"Could not write alignment cache '{cache_path}': {e}")
+
     def _stretch_segment_if_needed(
         self,
         audio_segment: npt.NDArray[np.float32],
@@ -539,7 +1020,10 @@ class VoxDeiSynthesizer:
         Calculates the required time stretch rate (`original_duration / target_duration`).
         If the absolute difference between the rate and 1.0 exceeds a threshold
         (`_STRETCH_RATE_THRESHOLD`), it applies time stretching using
-        `librosa.effects.time_stretch`.
+        `librosa.effects.time_stretch`, or `_wsola_stretch` when `config.use_wsola`
+        is set and the rate is within `_WSOLA_MIN_RATE`..`_WSOLA_MAX_RATE`. Rates
+        within `_RESAMPLE_STRETCH_THRESHOLD` of 1.0 are handled by resampling,
+        about ten times cheaper than vocoding a word.
 
         Args:
             audio_segment (npt.NDArray[np.float32]): The audio segment to process.
@@ -557,11 +1041,17 @@ class VoxDeiSynthesizer:
         Notes:
             Time stretching can introduce audio artifacts, especially with large
             stretch rates. Handles invalid (<=0) durations by returning the original segment.
+            Resampling couples pitch to duration: a word resampled by `rate` is
+            pitched up by the same factor (under 1.7 semitones within the threshold).
+            Duration control always runs ahead of the melody contour, which retunes
+            each segment to its MIDI pitch afterwards.
         """
         # Validate durations
         if original_duration <= 0 or target_duration <= 0:
             self.logger.warning(f"Word '{word_text}' ({segment_index+1}/{total_segments}): Invalid original ({original_duration:.3f}s) or target ({target_duration:.3f}s) duration. Using original segment.")
-            return audio_segment.astype(np.float32)
+            return _as_f32(audio_segment)
+        if original_duration == target_duration: # Exact match: nothing to stretch or log
+            return _as_f32(audio_segment)
 
         # Calculate stretch rate
         stretch_rate = original_duration / target_duration
@@ -570,18 +1060,26 @@ class VoxDeiSynthesizer:
         # Apply time stretching if rate is significantly different from 1.0
         if abs(stretch_rate - 1.0) > self._STRETCH_RATE_THRESHOLD:
             try:
-                # librosa time_stretch expects float32
-                stretched_segment = librosa.effects.time_stretch(y=audio_segment.astype(np.float32),
+                if abs(stretch_rate - 1.0) < self._RESAMPLE_STRETCH_THRESHOLD:
+                    # Played back at the original rate, `orig_sr` audio lasts 1/rate as long
+                    return librosa.resample(_as_f32(audio_segment), orig_sr=sample_rate * stretch_rate,
+                                            target_sr=sample_rate)
+                if self._use_wsola and _WSOLA_MIN_RATE < stretch_rate < _WSOLA_MAX_RATE:
+                    return _wsola_stretch(_as_f32(audio_segment), stretch_rate,
+                                          _WSOLA_FRAME_LENGTH, _WSOLA_HOP_LENGTH, _WSOLA_SEARCH)
+                # librosa time_stretch expects float32. It measures faster than pedalboard's
+                # Rubber Band stretch on word-length segments, so it stays the stretch backend.
+                stretched_segment = librosa.effects.time_stretch(y=_as_f32(audio_segment),
                                                                  rate=stretch_rate)
                 return stretched_segment
             except Exception as stretch_err:
                 self.logger.error(f"Error time stretching word '{word_text}' ({segment_index+1}/{total_segments}): {stretch_err}. Using original segment.", exc_info=True)
-                return audio_segment.astype(np.float32)
+                return _as_f32(audio_segment)
         else:
             # Use original segment if stretch rate is close to 1.0
-            return audio_segment.astype(np.float32)
+            return _as_f32(audio_segment)
 
-    def _apply_duration_control(self, audio: npt.NDArray[np.float32], sample_rate: int, text: str, target_durations_sec: Optional[List[float]]) -> npt.NDArray[np.float32]:
+    def _apply_duration_control(self, audio: npt.NDArray[np.float32], sample_rate: int, text: str, target_durations_sec: Optional[List[float]], cache: bool = True) -> npt.NDArray[np.float32]:
         """Applies duration control based on target durations using alignment and stretching.
 
         This method orchestrates the duration control process:
@@ -590,13 +1088,12 @@ class VoxDeiSynthesizer:
         2. Maps the aligned words to the provided `target_durations_sec` list
            (typically from MIDI). Handles mismatches by processing up to the
            minimum length of the two lists.
-        3. Iterates through aligned words:
-           - Preserves silence gaps between words.
-           - Extracts the audio segment for the word.
-           - Calls `_stretch_segment_if_needed` to apply time stretching
-             (`librosa.effects.time_stretch`) if the original duration differs
-             significantly from the target duration.
-        4. Concatenates the processed (potentially stretched) segments and silence gaps.
+        3. Calls `_stretch_segment_if_needed` for every aligned word to apply time
+           stretching (`librosa.effects.time_stretch`) if the original duration
+           differs significantly from the target duration. Utterances of at least
+           `_PARALLEL_STRETCH_MIN_WORDS` words are stretched on a thread pool.
+        4. Writes the processed (potentially stretched) segments and the silence
+           gaps between them consecutively into a single preallocated output.
 
         Args:
             audio (npt.NDArray[np.float32]): The input audio waveform.
@@ -604,6 +1101,8 @@ class VoxDeiSynthesizer:
             text (str): The original text corresponding to the audio.
             target_durations_sec (Optional[List[float]]): A list of target durations
                 in seconds. If None or empty, the original audio is returned.
+            cache (bool): Use the on-disk alignment cache (see `_perform_alignment`).
+                Defaults to True.
 
         Returns:
             npt.NDArray[np.float32]: The audio waveform with duration control applied,
@@ -622,73 +1121,98 @@ class VoxDeiSynthesizer:
         """
         if not target_durations_sec:
             self.logger.debug("No target durations provided for duration control, skipping.")
-            return audio.copy().astype(np.float32)
+            return _as_f32(audio)
 
         self.logger.info("Applying duration control...")
 
         # 1. Forced Alignment (using helper)
-        aligned_words_list = self._perform_alignment(audio, sample_rate, text)
+        aligned_words_list = self._perform_alignment(audio, sample_rate, text, cache=cache)
         if aligned_words_list is None:
-            return audio.copy().astype(np.float32) # Return original if alignment failed
+            return _as_f32(audio) # Return original if alignment failed
 
         # 2. Map Segments to Durations
         num_words = len(aligned_words_list)
         num_targets = len(target_durations_sec)
         if num_words != num_targets:
             self.logger.warning(f"Mismatch between aligned words ({num_words}) and target durations ({num_targets}). Mapping 1:1 up to the shorter length.")
-            min_len = min(num_words, num_targets)
-            aligned_words_list = aligned_words_list[:min_len]
-            target_durations_sec = target_durations_sec[:min_len]
-            num_words = min_len # Update count for iteration
+            num_words = min(num_words, num_targets) # Everything below reads only the first num_words entries
 
         # 3. Time Stretching
-        stretched_pieces = []
-        last_word_end_sample = 0
-
-        for i, word_obj in enumerate(aligned_words_list): # Rename loop variable
-            # Cast to Any to satisfy Pylance while using attribute access for mocks
-            word = cast(typing.Any, word_obj)
-            target_duration = target_durations_sec[i]
-            # Use attribute access for compatibility with test mocks
-            start_sample = int(word.start * sample_rate)
-            end_sample = int(word.end * sample_rate)
-            word_text = getattr(word, 'text', 'UNKNOWN') # Use getattr for mocks
-
-            # Handle silence/gap before the current word
-            if start_sample > last_word_end_sample:
-                silence_segment = audio[last_word_end_sample:start_sample]
-                stretched_pieces.append(silence_segment.astype(np.float32))
-                self.logger.debug(f"Preserving silence segment from {last_word_end_sample/sample_rate:.3f}s to {start_sample/sample_rate:.3f}s")
-
-            # Extract and stretch the word segment using the helper
-            audio_segment = audio[start_sample:end_sample]
-            original_duration = (end_sample - start_sample) / sample_rate
-
-            # Pass word_text obtained via getattr
-            stretched_segment = self._stretch_segment_if_needed(
-                audio_segment, sample_rate, original_duration, target_duration,
-                word_text, i, num_words
+        # Word boundaries in samples, converted in one pass
+        start_samples = (np.fromiter((word.start for word in aligned_words_list), dtype=np.float64, count=num_words) * sample_rate).astype(np.int64)
+        end_samples = (np.fromiter((word.end for word in aligned_words_list), dtype=np.float64, count=num_words) * sample_rate).astype(np.int64)
+        word_texts = [word.text for word in itertools.islice(aligned_words_list, num_words)]
+        word_spans: List[Tuple[int, int, str]] = list(zip(start_samples.tolist(), end_samples.tolist(), word_texts))
+
+        def stretch_word(i: int) -> npt.NDArray[np.float32]:
+            start_sample, end_sample, word_text = word_spans[i]
+            return self._stretch_segment_if_needed(
+                audio[start_sample:end_sample], sample_rate, (end_sample - start_sample) / sample_rate,
+                target_durations_sec[i], word_text, i, num_words
             )
-            stretched_pieces.append(stretched_segment)
 
-            last_word_end_sample = end_sample
-
-        # Handle potential silence after the last word
-        if last_word_end_sample < len(audio):
-            final_silence = audio[last_word_end_sample:]
-            stretched_pieces.append(final_silence.astype(np.float32))
-            self.logger.debug(f"Preserving final silence segment from {last_word_end_sample/sample_rate:.3f}s onwards")
+        # Words are stretched independently, so long utterances stretch them on a
+        # thread pool (librosa's FFT work releases the GIL); otherwise the stretches
+        # run in order and get the FFT threads instead.
+        if num_words >= _PARALLEL_STRETCH_MIN_WORDS and _FFT_WORKERS > 1:
+            with ThreadPoolExecutor(max_workers=_FFT_WORKERS) as executor:
+                stretched_segments = list(executor.map(stretch_word, range(num_words)))
+        else:
+            with scipy.fft.set_workers(_FFT_WORKERS):
+                stretched_segments = [stretch_word(i) for i in range(num_words)]
+
+        # 4. Assembly
+        # Pieces are written straight into a preallocated output instead of being
+        # collected and concatenated. The words are already stretched, so the output
+        # length is known up front: the gaps before each word, the stretched words
+        # and the tail after the last one (gaps past the end of the audio are shorter,
+        # so this is an upper bound and `_write_piece` never has to grow the buffer).
+        previous_end_samples = np.concatenate(([0], end_samples[:-1]))
+        capacity = (int(np.maximum(start_samples - previous_end_samples, 0).sum())
+                    + sum(len(stretched_segment) for stretched_segment in stretched_segments)
+                    + max(0, len(audio) - (int(end_samples[-1]) if num_words else 0)))
+        final_audio = np.empty(capacity, dtype=np.float32)
+        write_ptr = 0
+        last_word_end_sample = 0
 
-        # 4. Concatenate
-        if not stretched_pieces:
+        try:
+            for (start_sample, end_sample, _), stretched_segment in zip(word_spans, stretched_segments):
+                # Handle silence/gap before the current word
+                if start_sample > last_word_end_sample:
+                    final_audio, write_ptr = self._write_piece(final_audio, write_ptr, audio[last_word_end_sample:start_sample])
+                    self.logger.debug(f"Preserving silence segment from {last_word_end_sample/sample_rate:.3f}s to {start_sample/sample_rate:.3f}s")
+
+                final_audio, write_ptr = self._write_piece(final_audio, write_ptr, stretched_segment)
+                last_word_end_sample = end_sample
+
+            # Handle potential silence after the last word
+            if last_word_end_sample < len(audio):
+                final_audio, write_ptr = self._write_piece(final_audio, write_ptr, audio[last_word_end_sample:])
+                self.logger.debug(f"Preserving final silence segment from {last_word_end_sample/sample_rate:.3f}s onwards")
+        except ValueError as write_err:
+            self.logger.error(f"Error assembling duration-controlled segments: {write_err}. Returning original audio.", exc_info=True)
+            return _as_f32(audio)
+
+        # 5. Result
+        if write_ptr == 0:
             self.logger.warning("No segments were processed or collected during duration control. Returning original audio.")
-            return audio.copy().astype(np.float32)
+            return _as_f32(audio)
 
-        try:
-            final_audio = np.concatenate(stretched_pieces)
-            self.logger.info("Duration control applied successfully.")
-            return final_audio.astype(np.float32)
-        except ValueError as concat_err:
-            self.logger.error(f"Error concatenating duration-controlled segments: {concat_err}. Returning original audio.", exc_info=True)
-            return audio.copy().astype(np.float32)
+        self.logger.info("Duration control applied successfully.")
+        return final_audio[:write_ptr]
+
+    @staticmethod
+    def _write_piece(buffer: npt.NDArray[np.float32], write_ptr: int, piece: npt.NDArray) -> Tuple[npt.NDArray[np.float32], int]:
+        """Copy `piece` into `buffer` at `write_ptr`, growing the buffer if it is too small.
+
+        Returns:
+            Tuple[npt.NDArray[np.float32], int]: The (possibly reallocated) buffer and the new write position.
+        """
+        end = write_ptr + len(piece)
+        if end > len(buffer):
+            grown = np.empty(max(end, 2 * len(buffer)), dtype=np.float32)
+            grown[:write_ptr] = buffer[:write_ptr]
+            buffer = grown
+        buffer[write_ptr:end] = piece
+        return buffer, end
 
@@ -1,14 +1,20 @@
 import os
 import logging
-from typing import List, Tuple
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
 
 import pretty_midi
 import librosa
-import numpy as np # librosa.midi_to_hz returns numpy float
+import numpy as np
+import numpy.typing as npt
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Frequencies for every MIDI note number, computed once instead of per note
+_MIDI_TO_HZ = librosa.midi_to_hz(np.arange(128))
+
 class MidiParsingError(ValueError):
     """Custom exception for errors encountered during MIDI parsing."""
     pass
@@ -16,6 +22,7 @@ class MidiParsingError(ValueError):
 def parse_midi_melody(midi_path: str, instrument_index: int = 0) -> List[Tuple[float, float]]:
     """
     Parses a MIDI file to extract a melody contour from a specific instrument/track.
+    Parsed melodies are cached until the file's modification time or size changes.
 
     Args:
         midi_path: Path to the MIDI file.
@@ -30,50 +37,126 @@ def parse_midi_melody(midi_path: str, instrument_index: int = 0) -> List[Tuple[f
         FileNotFoundError: If the midi_path does not exist.
         MidiParsingError: If the MIDI file is invalid or cannot be parsed.
     """
+    return [(pitch_hz, duration_sec) for pitch_hz, duration_sec in _cached_melody(midi_path, instrument_index).tolist()]
+
+def parse_midi_melody_array(midi_path: str, instrument_index: int = 0) -> npt.NDArray[np.float64]:
+    """
+    Parses a MIDI file like `parse_midi_melody`, returning the melody as an array.
+
+    Args:
+        midi_path: Path to the MIDI file.
+        instrument_index: The index of the instrument (track) to parse (default: 0).
+
+    Returns:
+        A float64 array of shape (N, 2) with one (pitch_hz, duration_seconds) row per
+        note, which `VoxDeiSynthesizer._apply_melody_contour` accepts directly. Empty
+        (shape (0, 2)) in the cases where `parse_midi_melody` returns an empty list.
+
+    Raises:
+        FileNotFoundError: If the midi_path does not exist.
+        MidiParsingError: If the MIDI file is invalid or cannot be parsed.
+    """
+    return _cached_melody(midi_path, instrument_index).copy()
+
+def _cached_melody(midi_path: str, instrument_index: int) -> npt.NDArray[np.float64]:
+    """
+    Returns the cached (read-only) melody array for the current version of `midi_path`.
+    """
     if not os.path.exists(midi_path):
         raise FileNotFoundError(f"MIDI file not found at path: {midi_path}")
 
-    melody: List[Tuple[float, float]] = []
+    # Parsed melodies are cached per file version; callers get copies so they can't alter the cache
+    stat = os.stat(midi_path)
+    return _parse_midi_melody_cached(os.path.abspath(midi_path), instrument_index, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=64)
+def _parse_midi_melody_cached(midi_path: str, instrument_index: int, _mtime_ns: int, _size: int) -> npt.NDArray[np.float64]:
+    """
+    Parses the melody for `parse_midi_melody`, memoized on the file's path, modification time and size.
+
+    The melody is stored as one read-only (N, 2) float64 array of (pitch_hz, duration_seconds)
+    rows rather than a list of tuples.
+    """
+    melody = np.empty((0, 2), dtype=np.float64)
     try:
         midi_data = pretty_midi.PrettyMIDI(midi_path)
 
         if not midi_data.instruments:
             logger.warning(f"No instruments found in MIDI file: {midi_path}")
-            return []
+            return _read_only(melody)
 
         if instrument_index >= len(midi_data.instruments):
             logger.warning(f"Instrument index {instrument_index} out of bounds for MIDI file: {midi_path} (found {len(midi_data.instruments)} instruments)")
-            return []
+            return _read_only(melody)
 
         instrument = midi_data.instruments[instrument_index]
 
         if not instrument.notes:
             logger.warning(f"No notes found in instrument {instrument_index} ('{instrument.name}') of MIDI file: {midi_path}")
-            return []
+            return _read_only(melody)
+
+        # Note fields as arrays, sorted by start time just in case (stable, like list.sort)
+        notes = instrument.notes
+        pitches = np.fromiter((note.pitch for note in notes), dtype=np.int64, count=len(notes))
+        starts = np.fromiter((note.start for note in notes), dtype=np.float64, count=len(notes))
+        ends = np.fromiter((note.end for note in notes), dtype=np.float64, count=len(notes))
+        order = np.argsort(starts, kind='stable')
+        pitches, starts, ends = pitches[order], starts[order], ends[order]
+        durations = ends - starts
+
+        # Skip invalid pitches and zero or negative duration notes
+        valid = (pitches > 0) & (durations > 0)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i in np.flatnonzero(~valid).tolist():
+                if pitches[i] <= 0:
+                    logger.debug(f"Skipping note with invalid pitch {pitches[i]} at time {starts[i]}")
+                else:
+                    logger.debug(f"Skipping note with non-positive duration {durations[i]} at time {starts[i]}")
+
+        # Convert MIDI pitch to Hz via the precomputed table
+        melody = np.column_stack((_MIDI_TO_HZ[pitches[valid]], durations[valid]))
 
-        # Sort notes by start time just in case
-        instrument.notes.sort(key=lambda note: note.start)
+    except Exception as e:
+        logger.error(f"Failed to parse MIDI file '{midi_path}': {e}", exc_info=True)
+        raise MidiParsingError(f"Error parsing MIDI file '{midi_path}': {e}") from e
 
-        for note in instrument.notes:
-            if note.pitch <= 0: # Skip invalid pitches
-                logger.debug(f"Skipping note with invalid pitch {note.pitch} at time {note.start}")
-                continue
+    if not len(melody):
+         logger.warning(f"Successfully parsed MIDI file '{midi_path}' but extracted no valid notes from instrument {instrument_index}.")
 
-            duration_sec = note.end - note.start
-            if duration_sec <= 0: # Skip zero or negative duration notes
-                 logger.debug(f"Skipping note with non-positive duration {duration_sec} at time {note.start}")
-                 continue
+    return _read_only(melody)
 
-            # Convert MIDI pitch to Hz. librosa returns np.float64, cast to float.
-            pitch_hz = float(librosa.midi_to_hz(note.pitch))
+def _read_only(melody: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Marks a cached melody array read-only."""
+    melody.flags.writeable = False
+    return melody
 
-            melody.append((pitch_hz, duration_sec))
 
-    except Exception as e:
-        logger.error(f"Failed to parse MIDI file '{midi_path}': {e}", exc_info=True)
-        raise MidiParsingError(f"Error parsing MIDI file '{midi_path}': {e}") from e
+def parse_midi_melodies(midi_paths: Sequence[str], instrument_index: int = 0, workers: Optional[int] = None) -> List[List[Tuple[float, float]]]:
+    """
+    Parses several MIDI files in parallel worker processes.
 
-    if not melody:
-         logger.warning(f"Successfully parsed MIDI file '{midi_path}' but extracted no valid notes from instrument {instrument_index}.")
+    Each file is parsed independently with `parse_midi_melody`; the files are
+    spread over a process pool in chunks so that many small files do not pay
+    one round trip each.
+
+    Args:
+        midi_paths: Paths to the MIDI files.
+        instrument_index: The index of the instrument (track) to parse in every file (default: 0).
+        workers: Number of worker processes (default: `os.cpu_count()`).
 
-    return melody
\ No newline at end of file
+    Returns:
+        One melody per path, in the order of `midi_paths` (see `parse_midi_melody`).
+
+    Raises:
+        FileNotFoundError: If one of the paths does not exist.
+        MidiParsingError: If one of the MIDI files is invalid or cannot be parsed.
+    """
+    if not midi_paths:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(midi_paths))
+    if workers == 1:
+        return [parse_midi_melody(path, instrument_index) for path in midi_paths]
+
+    chunksize = max(1, len(midi_paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_midi_melody, midi_paths, [instrument_index] * len(midi_paths), chunksize=chunksize))
@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 from pydantic import ValidationError
+from scipy.fft import rfft, rfftfreq
 
 # Import Pedalboard from internal module as suggested by Pylance
 from pedalboard import Delay, Reverb
@@ -30,35 +31,62 @@ from robotic_psalms.synthesis.effects import (
 
 SAMPLE_RATE = 44100
 
-@pytest.fixture
+
+def _read_only(signal: np.ndarray) -> np.ndarray:
+    """Freeze a session-scoped test signal so no test can alter it for the others."""
+    signal.setflags(write=False)
+    return signal
+
+def _differs(a: np.ndarray, b: np.ndarray, rtol: float = 1e-05, atol: float = 1e-08, probe: int = 1024) -> bool:
+    """`not np.allclose(a, b)`, deciding from the first `probe` samples when they already differ."""
+    if a.shape == b.shape and a.size:
+        head_b = np.abs(b[:probe])
+        if np.max(np.abs(a[:probe] - b[:probe])) > atol + rtol * np.max(head_b):
+            return True
+    return not np.allclose(a, b, rtol=rtol, atol=atol)
+
+def _rms(signal: np.ndarray) -> float:
+    """RMS over all samples (and channels) as one dot product, without a squared temporary."""
+    flat = signal.ravel()
+    return float(np.sqrt(np.dot(flat, flat) / flat.size))
+
+# Generated signals are built once per session and shared read-only across tests
+@pytest.fixture(scope="session")
 def dry_mono_signal():
     """A simple mono audio signal."""
-    return np.sin(np.linspace(0, 440 * 2 * np.pi, SAMPLE_RATE)).astype(np.float32)
+    return _read_only(np.sin(np.linspace(0, 440 * 2 * np.pi, SAMPLE_RATE)).astype(np.float32))
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dry_stereo_signal():
     """A simple stereo audio signal."""
-    mono = np.sin(np.linspace(0, 440 * 2 * np.pi, SAMPLE_RATE)).astype(np.float32)
-    return np.stack([mono, mono * 0.8], axis=-1) # Simple stereo difference
+    # Fill the channels-last buffer in place rather than stacking two mono copies
+    stereo = np.empty((SAMPLE_RATE, 2), dtype=np.float32)
+    np.sin(np.linspace(0, 440 * 2 * np.pi, SAMPLE_RATE), out=stereo[:, 0])
+    np.multiply(stereo[:, 0], np.float32(0.8), out=stereo[:, 1]) # Simple stereo difference
+    return _read_only(stereo)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def impulse_signal():
     """A simple impulse signal (mono)."""
     signal = np.zeros(SAMPLE_RATE, dtype=np.float32)
     signal[0] = 1.0 # Single sample impulse at the beginning
-    return signal
+    return _read_only(signal)
 
-@pytest.fixture
-def white_noise_mono(duration_sec=1.0):
-    """Generate mono white noise."""
+@pytest.fixture(scope="session")
+def white_noise_buffer(duration_sec=1.0):
+    """Seeded noise for two channels, generated once and viewed by the noise fixtures."""
     num_samples = int(duration_sec * SAMPLE_RATE)
-    return np.random.randn(num_samples).astype(np.float32)
+    return _read_only(np.random.default_rng(0).standard_normal(2 * num_samples, dtype=np.float32))
 
-@pytest.fixture
-def white_noise_stereo(duration_sec=1.0):
+@pytest.fixture(scope="session")
+def white_noise_mono(white_noise_buffer):
+    """Generate mono white noise."""
+    return white_noise_buffer[:len(white_noise_buffer) // 2]
+
+@pytest.fixture(scope="session")
+def white_noise_stereo(white_noise_buffer):
     """Generate stereo white noise."""
-    num_samples = int(duration_sec * SAMPLE_RATE)
-    return np.random.randn(num_samples, 2).astype(np.float32)
+    return white_noise_buffer.reshape(-1, 2)
 
 @pytest.fixture
 def default_reverb_params():
@@ -76,9 +104,9 @@ def default_formant_shift_params():
     """Default formant shift parameters."""
     return FormantShiftParameters(shift_factor=1.5) # Example: Shift up
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_delay_params():
-    """Default complex delay parameters."""
+    """Default complex delay parameters (shared; tests derive variants via model_copy)."""
     return DelayParameters(
         delay_time_ms=500.0,
         feedback=0.5,
@@ -90,7 +118,12 @@ def default_delay_params():
         filter_high_hz=5000.0
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def delayed_default_mono(dry_mono_signal, default_delay_params):
+    """`dry_mono_signal` through the default delay, computed once for the parameter tests."""
+    return _read_only(apply_complex_delay(dry_mono_signal, SAMPLE_RATE, default_delay_params))
+
+@pytest.fixture(scope="module")
 def default_resonant_filter_params():
     """Default resonant low-pass filter parameters."""
     return ResonantFilterParameters(
@@ -98,7 +131,7 @@ def default_resonant_filter_params():
         q=2.0 # Renamed from resonance
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_bandpass_filter_params():
     """Default bandpass filter parameters."""
     return BandpassFilterParameters(
@@ -107,8 +140,18 @@ def default_bandpass_filter_params():
         order=2 # Default order
     )
 
+@pytest.fixture(scope="module")
+def lowpass_default_mono(white_noise_mono, default_resonant_filter_params):
+    """`white_noise_mono` through the default RBJ low-pass, shared by the low-pass tests."""
+    return _read_only(apply_rbj_lowpass_filter(white_noise_mono, SAMPLE_RATE, default_resonant_filter_params))
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def bandpass_default_mono(white_noise_mono, default_bandpass_filter_params):
+    """`white_noise_mono` through the default bandpass (order 2), shared by the bandpass tests."""
+    return _read_only(apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params))
+
+
+@pytest.fixture(scope="module")
 def default_chorus_params():
     """Default chorus parameters."""
     return ChorusParameters(
@@ -122,17 +165,18 @@ def default_chorus_params():
 
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chirp_signal_mono(duration_sec=2.0):
     """Generate a mono chirp signal (frequency increases over time)."""
     num_samples = int(duration_sec * SAMPLE_RATE)
-    t = np.linspace(0, duration_sec, num_samples, endpoint=False)
+    t = np.arange(num_samples) / SAMPLE_RATE
     start_freq = 100
     end_freq = 5000
-    # Use scipy's chirp for simplicity
-    from scipy.signal import chirp
-    signal = chirp(t, f0=start_freq, f1=end_freq, t1=duration_sec, method='logarithmic')
-    return signal.astype(np.float32)
+    # Closed form of scipy.signal.chirp(method='logarithmic'): the phase integrates
+    # f(t) = start_freq * k**t, so the same sweep needs no scipy dispatch
+    k = (end_freq / start_freq) ** (1 / duration_sec)
+    phase = (2 * np.pi * start_freq / np.log(k)) * (k ** t - 1)
+    return _read_only(np.cos(phase).astype(np.float32)) # Phase reaches ~1e4 rad, so keep it float64
 
 @pytest.fixture
 def default_spectral_freeze_params():
@@ -144,7 +188,7 @@ def default_spectral_freeze_params():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_glitch_params():
     """Default refined glitch parameters (using 'repeat' type)."""
     return GlitchParameters(
@@ -157,7 +201,7 @@ def default_glitch_params():
         bitcrush_rate_factor=0.5 # Irrelevant for 'repeat'
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_saturation_params():
     """Default saturation parameters."""
     return SaturationParameters(
@@ -183,24 +227,38 @@ def default_master_dynamics_params():
         # makeup_gain_db is not a parameter of MasterDynamicsParameters
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dynamic_signal_mono(duration_sec=2.0):
     """Generate a mono signal with quiet and loud sections."""
     num_samples = int(duration_sec * SAMPLE_RATE)
     half_samples = num_samples // 2
-    t_quiet = np.linspace(0, duration_sec / 2, half_samples, endpoint=False)
-    t_loud = np.linspace(duration_sec / 2, duration_sec, num_samples - half_samples, endpoint=False)
-
-    quiet_part = 0.1 * np.sin(2 * np.pi * 440 * t_quiet)
-    loud_part = 0.9 * np.sin(2 * np.pi * 440 * t_loud)
+    t = np.arange(num_samples, dtype=np.float32) / SAMPLE_RATE
+    signal = np.sin((2 * np.pi * 440) * t, dtype=np.float32)
+    signal[:half_samples] *= 0.1 # Quiet first half
+    signal[half_samples:] *= 0.9 # Loud second half
+    return _read_only(signal)
+# --- Module Surface ---
+
+def test_module_surface():
+    """Checks every effect's entry point and the parameter fields its tests rely on."""
+    surface = [
+        (apply_high_quality_reverb, ReverbParameters, ['decay_time']),
+        (apply_robust_formant_shift, FormantShiftParameters, ['shift_factor']),
+        (apply_complex_delay, DelayParameters, ['delay_time_ms']),
+        (apply_rbj_lowpass_filter, ResonantFilterParameters, ['q']),
+        (apply_bandpass_filter, BandpassFilterParameters, ['center_hz', 'q', 'order']),
+        (apply_chorus, ChorusParameters, ['rate_hz', 'depth', 'delay_ms', 'feedback', 'num_voices', 'wet_dry_mix']),
+        (apply_smooth_spectral_freeze, SpectralFreezeParameters, ['freeze_point', 'blend_amount', 'fade_duration']),
+        (apply_refined_glitch, GlitchParameters, ['glitch_type', 'intensity', 'chunk_size_ms', 'repeat_count', 'tape_stop_speed', 'bitcrush_depth', 'bitcrush_rate_factor']),
+        (apply_saturation, SaturationParameters, ['drive', 'tone', 'mix']),
+        (apply_master_dynamics, MasterDynamicsParameters, ['compressor_threshold_db', 'limiter_threshold_db']),
+    ]
+    for effect_func, params_cls, fields in surface:
+        assert callable(effect_func), f"{effect_func!r} is not callable"
+        missing = [field for field in fields if field not in params_cls.model_fields]
+        assert not missing, f"{params_cls.__name__} is missing fields: {missing}"
 
-    signal = np.concatenate((quiet_part, loud_part))
-    return signal.astype(np.float32)
 # --- Reverb Tests ---
-def test_reverb_module_exists():
-    assert callable(apply_high_quality_reverb)
-    assert 'decay_time' in ReverbParameters.model_fields
-
 def test_reverb_applies_effect(dry_mono_signal, default_reverb_params):
     wet_signal = apply_high_quality_reverb(
         dry_mono_signal, SAMPLE_RATE, default_reverb_params
@@ -209,7 +267,7 @@ def test_reverb_applies_effect(dry_mono_signal, default_reverb_params):
     assert len(wet_signal) >= len(dry_mono_signal) # Reverb adds tail
     # Check if the beginning of the signals differ significantly
     min_len = min(len(wet_signal), len(dry_mono_signal))
-    assert not np.allclose(wet_signal[:min_len], dry_mono_signal[:min_len]), "Reverb did not alter the signal significantly"
+    assert _differs(wet_signal[:min_len], dry_mono_signal[:min_len]), "Reverb did not alter the signal significantly"
 
 def test_reverb_handles_mono_input(dry_mono_signal, default_reverb_params):
     wet_signal = apply_high_quality_reverb(
@@ -236,14 +294,14 @@ def test_reverb_parameters_affect_output(dry_mono_signal, default_reverb_params)
         dry_mono_signal, SAMPLE_RATE, params_long_decay
     )
     min_len_decay = min(len(wet_signal_default), len(wet_signal_long_decay))
-    assert not np.allclose(wet_signal_default[:min_len_decay], wet_signal_long_decay[:min_len_decay]), "Changing decay time had no effect"
+    assert _differs(wet_signal_default[:min_len_decay], wet_signal_long_decay[:min_len_decay]), "Changing decay time had no effect"
 
     params_more_wet = default_reverb_params.model_copy(update={'wet_dry_mix': 0.8})
     wet_signal_more_wet = apply_high_quality_reverb(
         dry_mono_signal, SAMPLE_RATE, params_more_wet
     )
     min_len_wet = min(len(wet_signal_default), len(wet_signal_more_wet))
-    assert not np.allclose(wet_signal_default[:min_len_wet], wet_signal_more_wet[:min_len_wet]), "Changing wet/dry mix had no effect"
+    assert _differs(wet_signal_default[:min_len_wet], wet_signal_more_wet[:min_len_wet]), "Changing wet/dry mix had no effect"
 
     params_more_predelay = default_reverb_params.model_copy(update={'pre_delay': 0.1})
     wet_signal_more_predelay = apply_high_quality_reverb(
@@ -259,18 +317,14 @@ def test_reverb_handles_zero_length_input(default_reverb_params):
     assert isinstance(wet_signal, np.ndarray)
     assert len(wet_signal) == 0
 
-def test_reverb_invalid_parameters(dry_mono_signal):
+# Invalid parameters are rejected when the model is built, so no effect is run
+@pytest.mark.parametrize("kwargs", [
+    dict(decay_time=-1.0, pre_delay=0.02, diffusion=0.7, damping=0.5, wet_dry_mix=0.3),
+    dict(decay_time=2.5, pre_delay=0.02, diffusion=0.7, damping=0.5, wet_dry_mix=1.5),
+])
+def test_reverb_invalid_parameters(kwargs):
     with pytest.raises((ValidationError, ValueError)):
-        invalid_params = ReverbParameters(
-            decay_time=-1.0, pre_delay=0.02, diffusion=0.7, damping=0.5, wet_dry_mix=0.3
-        )
-        apply_high_quality_reverb(dry_mono_signal, SAMPLE_RATE, invalid_params)
-
-    with pytest.raises((ValidationError, ValueError)):
-        invalid_params = ReverbParameters(
-            decay_time=2.5, pre_delay=0.02, diffusion=0.7, damping=0.5, wet_dry_mix=1.5
-        )
-        apply_high_quality_reverb(dry_mono_signal, SAMPLE_RATE, invalid_params)
+        ReverbParameters(**kwargs)
 
 # --- Formant Shifting Tests (REQ-ART-V01) ---
 
@@ -278,16 +332,12 @@ def test_reverb_invalid_parameters(dry_mono_signal):
 def formant_shift_params_no_shift():
     return FormantShiftParameters(shift_factor=1.0)
 
-def test_formant_shift_module_exists():
-    assert callable(apply_robust_formant_shift)
-    assert 'shift_factor' in FormantShiftParameters.model_fields
-
 def test_formant_shift_applies_effect(dry_mono_signal, default_formant_shift_params):
     shifted_signal = apply_robust_formant_shift(
         dry_mono_signal, SAMPLE_RATE, default_formant_shift_params
     )
     assert shifted_signal.ndim == dry_mono_signal.ndim
-    assert not np.allclose(shifted_signal, dry_mono_signal), "Formant shift did not alter the signal"
+    assert _differs(shifted_signal, dry_mono_signal), "Formant shift did not alter the signal"
 
 def test_formant_shift_handles_mono(dry_mono_signal, default_formant_shift_params):
     shifted_signal = apply_robust_formant_shift(
@@ -309,11 +359,11 @@ def test_formant_shift_preserves_pitch(dry_mono_signal, default_formant_shift_pa
     shifted_signal = apply_robust_formant_shift(
         dry_mono_signal, SAMPLE_RATE, default_formant_shift_params
     )
-    fft_result = np.fft.fft(shifted_signal)
-    fft_freq = np.fft.fftfreq(len(shifted_signal), 1 / SAMPLE_RATE)
-    positive_mask = fft_freq > 0
-    peak_index = np.argmax(np.abs(fft_result[positive_mask]))
-    detected_freq = fft_freq[positive_mask][peak_index]
+    # Real input, so only the non-negative bins are needed; skip DC
+    fft_result = rfft(shifted_signal, workers=-1)
+    fft_freq = rfftfreq(len(shifted_signal), 1 / SAMPLE_RATE)
+    peak_index = np.argmax(np.abs(fft_result[1:])) + 1
+    detected_freq = fft_freq[peak_index]
     assert np.isclose(detected_freq, input_freq, atol=10), f"Fundamental frequency shifted from {input_freq} Hz to {detected_freq} Hz"
 
 def test_formant_shift_parameters_affect_output(dry_mono_signal, formant_shift_params_no_shift):
@@ -326,7 +376,7 @@ def test_formant_shift_parameters_affect_output(dry_mono_signal, formant_shift_p
     shifted_signal_down = apply_robust_formant_shift(
         dry_mono_signal, SAMPLE_RATE, params_shifted
     )
-    assert not np.allclose(unshifted_signal, shifted_signal_down), "Changing shift_factor had no effect"
+    assert _differs(unshifted_signal, shifted_signal_down), "Changing shift_factor had no effect"
 
 def test_formant_shift_handles_zero_length(default_formant_shift_params):
     zero_signal = np.array([], dtype=np.float32)
@@ -336,27 +386,19 @@ def test_formant_shift_handles_zero_length(default_formant_shift_params):
     assert isinstance(shifted_signal, np.ndarray)
     assert len(shifted_signal) == 0
 
-def test_formant_shift_invalid_parameters(dry_mono_signal):
-    with pytest.raises((ValidationError, ValueError)):
-        invalid_params = FormantShiftParameters(shift_factor=0.0)
-        apply_robust_formant_shift(dry_mono_signal, SAMPLE_RATE, invalid_params)
-
+@pytest.mark.parametrize("shift_factor", [0.0, -1.5])
+def test_formant_shift_invalid_parameters(shift_factor):
     with pytest.raises((ValidationError, ValueError)):
-        invalid_params = FormantShiftParameters(shift_factor=-1.5)
-        apply_robust_formant_shift(dry_mono_signal, SAMPLE_RATE, invalid_params)
+        FormantShiftParameters(shift_factor=shift_factor)
 
 # --- Complex Delay Tests (REQ-ART-V02) ---
 
-def test_complex_delay_module_exists():
-    assert callable(apply_complex_delay)
-    assert 'delay_time_ms' in DelayParameters.model_fields
-
 def test_apply_complex_delay_mono(dry_mono_signal, default_delay_params):
     delayed_signal = apply_complex_delay(
         dry_mono_signal, SAMPLE_RATE, default_delay_params
     )
     assert delayed_signal.ndim == dry_mono_signal.ndim
-    assert not np.allclose(delayed_signal, dry_mono_signal), "Delay did not alter mono signal"
+    assert _differs(delayed_signal, dry_mono_signal), "Delay did not alter mono signal"
 
 def test_apply_complex_delay_stereo(dry_stereo_signal, default_delay_params):
     delayed_signal = apply_complex_delay(
@@ -364,13 +406,23 @@ def test_apply_complex_delay_stereo(dry_stereo_signal, default_delay_params):
     )
     assert delayed_signal.ndim == dry_stereo_signal.ndim
     assert delayed_signal.shape[1] == 2
-    assert not np.allclose(delayed_signal, dry_stereo_signal), "Delay did not alter stereo signal"
-
-def test_complex_delay_time_parameter(dry_mono_signal, default_delay_params):
-    delayed_default = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, default_delay_params)
-    params_changed = default_delay_params.model_copy(update={'delay_time_ms': 250.0})
+    assert _differs(delayed_signal, dry_stereo_signal), "Delay did not alter stereo signal"
+
+_NO_LFO = pytest.mark.xfail(reason="pedalboard.Delay does not support LFO")
+_NO_FEEDBACK_FILTER = pytest.mark.xfail(reason="pedalboard.Delay does not support feedback path filtering")
+
+@pytest.mark.parametrize("field, value, label", [
+    ('delay_time_ms', 250.0, "delay time"),
+    ('wet_dry_mix', 0.9, "wet/dry mix"),
+    pytest.param('lfo_rate_hz', 2.0, "LFO rate", marks=_NO_LFO),
+    pytest.param('lfo_depth', 0.5, "LFO depth", marks=_NO_LFO),
+    pytest.param('filter_low_hz', 500.0, "low-pass filter", marks=_NO_FEEDBACK_FILTER),
+    pytest.param('filter_high_hz', 2000.0, "high-pass filter", marks=_NO_FEEDBACK_FILTER),
+])
+def test_complex_delay_param_affects_output(dry_mono_signal, default_delay_params, delayed_default_mono, field, value, label):
+    params_changed = default_delay_params.model_copy(update={field: value})
     delayed_changed = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(delayed_default, delayed_changed), "Changing delay time had no effect"
+    assert _differs(delayed_default_mono, delayed_changed), f"Changing {label} had no effect"
 
 @pytest.mark.xfail(reason="pedalboard.Delay feedback parameter might have issues or test is not sensitive enough")
 def test_complex_delay_feedback_parameter(impulse_signal, default_delay_params):
@@ -380,48 +432,14 @@ def test_complex_delay_feedback_parameter(impulse_signal, default_delay_params):
     params_high_fb = params_low_fb.model_copy(update={'feedback': 0.9})
     delayed_changed = apply_complex_delay(impulse_signal, SAMPLE_RATE, params_high_fb)
 
-    assert not np.allclose(delayed_default, delayed_changed, atol=1e-9), "Changing feedback had no effect even with stricter tolerance"
-
-def test_complex_delay_wet_dry_mix_parameter(dry_mono_signal, default_delay_params):
-    delayed_default = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, default_delay_params)
-    params_changed = default_delay_params.model_copy(update={'wet_dry_mix': 0.9})
-    delayed_changed = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(delayed_default, delayed_changed), "Changing wet/dry mix had no effect"
+    assert _differs(delayed_default, delayed_changed, atol=1e-9), "Changing feedback had no effect even with stricter tolerance"
 
 @pytest.mark.xfail(reason="pedalboard.Delay does not support stereo_spread")
 def test_complex_delay_stereo_spread_parameter(dry_stereo_signal, default_delay_params):
     delayed_default = apply_complex_delay(dry_stereo_signal, SAMPLE_RATE, default_delay_params)
     params_changed = default_delay_params.model_copy(update={'stereo_spread': 0.9})
     delayed_changed = apply_complex_delay(dry_stereo_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(delayed_default, delayed_changed), "Changing stereo spread had no effect"
-
-@pytest.mark.xfail(reason="pedalboard.Delay does not support LFO")
-def test_complex_delay_lfo_rate_parameter(dry_mono_signal, default_delay_params):
-    delayed_default = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, default_delay_params)
-    params_changed = default_delay_params.model_copy(update={'lfo_rate_hz': 2.0})
-    delayed_changed = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(delayed_default, delayed_changed), "Changing LFO rate had no effect"
-
-@pytest.mark.xfail(reason="pedalboard.Delay does not support LFO")
-def test_complex_delay_lfo_depth_parameter(dry_mono_signal, default_delay_params):
-    delayed_default = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, default_delay_params)
-    params_changed = default_delay_params.model_copy(update={'lfo_depth': 0.5})
-    delayed_changed = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(delayed_default, delayed_changed), "Changing LFO depth had no effect"
-
-@pytest.mark.xfail(reason="pedalboard.Delay does not support feedback path filtering")
-def test_complex_delay_filter_low_parameter(dry_mono_signal, default_delay_params):
-    delayed_default = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, default_delay_params)
-    params_changed = default_delay_params.model_copy(update={'filter_low_hz': 500.0})
-    delayed_changed = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(delayed_default, delayed_changed), "Changing low-pass filter had no effect"
-
-@pytest.mark.xfail(reason="pedalboard.Delay does not support feedback path filtering")
-def test_complex_delay_filter_high_parameter(dry_mono_signal, default_delay_params):
-    delayed_default = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, default_delay_params)
-    params_changed = default_delay_params.model_copy(update={'filter_high_hz': 2000.0})
-    delayed_changed = apply_complex_delay(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(delayed_default, delayed_changed), "Changing high-pass filter had no effect"
+    assert _differs(delayed_default, delayed_changed), "Changing stereo spread had no effect"
 
 def test_complex_delay_zero_length_input(default_delay_params):
     zero_signal = np.array([], dtype=np.float32)
@@ -431,50 +449,26 @@ def test_complex_delay_zero_length_input(default_delay_params):
     assert isinstance(delayed_signal, np.ndarray)
     assert len(delayed_signal) == 0
 
-def test_complex_delay_invalid_parameters(dry_mono_signal):
-    with pytest.raises((ValidationError, ValueError)):
-        invalid_params = DelayParameters(
-            delay_time_ms=500.0, feedback=1.5, wet_dry_mix=0.4, # Invalid feedback
-            stereo_spread=0.3, lfo_rate_hz=0.5, lfo_depth=0.1, filter_low_hz=100.0, filter_high_hz=5000.0
-        )
-        apply_complex_delay(dry_mono_signal, SAMPLE_RATE, invalid_params)
-
-    with pytest.raises((ValidationError, ValueError)):
-        invalid_params = DelayParameters(
-            delay_time_ms=500.0, feedback=0.5, wet_dry_mix=0.4, lfo_rate_hz=-1.0, # Invalid LFO rate
-            stereo_spread=0.3, lfo_depth=0.1, filter_low_hz=100.0, filter_high_hz=5000.0
-        )
-        apply_complex_delay(dry_mono_signal, SAMPLE_RATE, invalid_params)
-
+@pytest.mark.parametrize("update", [
+    {'feedback': 1.5}, # Invalid feedback
+    {'lfo_rate_hz': -1.0}, # Invalid LFO rate
+    {'filter_low_hz': 6000.0, 'filter_high_hz': 5000.0}, # Invalid filter range
+])
+def test_complex_delay_invalid_parameters(default_delay_params, update):
     with pytest.raises((ValidationError, ValueError)):
-        invalid_params = DelayParameters(
-            delay_time_ms=500.0, feedback=0.5, wet_dry_mix=0.4, filter_low_hz=6000.0, filter_high_hz=5000.0, # Invalid filter range
-            stereo_spread=0.3, lfo_rate_hz=0.5, lfo_depth=0.1
-        )
-        apply_complex_delay(dry_mono_signal, SAMPLE_RATE, invalid_params)
+        DelayParameters(**{**default_delay_params.model_dump(), **update})
 
 
 # --- Atmospheric Filtering Tests (REQ-ART-V02) ---
 
-def test_atmospheric_filter_modules_exist():
-    """Checks if the atmospheric filter imports work."""
-    assert callable(apply_rbj_lowpass_filter) # Renamed
-    assert 'q' in ResonantFilterParameters.model_fields # Renamed field
-    assert callable(apply_bandpass_filter)
-    assert 'center_hz' in BandpassFilterParameters.model_fields
-    assert 'q' in BandpassFilterParameters.model_fields
-    assert 'order' in BandpassFilterParameters.model_fields # Added field
-
 # -- Resonant Low-Pass Filter Tests --
 
-def test_apply_rbj_lowpass_filter_mono(white_noise_mono, default_resonant_filter_params): # Renamed test
+def test_apply_rbj_lowpass_filter_mono(white_noise_mono, lowpass_default_mono): # Renamed test
     """Test applying RBJ low-pass filter to a mono signal."""
-    filtered_signal = apply_rbj_lowpass_filter( # Renamed function call
-        white_noise_mono, SAMPLE_RATE, default_resonant_filter_params
-    )
+    filtered_signal = lowpass_default_mono
     assert filtered_signal.ndim == white_noise_mono.ndim
     assert len(filtered_signal) == len(white_noise_mono)
-    assert not np.allclose(filtered_signal, white_noise_mono), "RBJ low-pass filter did not alter mono signal"
+    assert _differs(filtered_signal, white_noise_mono), "RBJ low-pass filter did not alter mono signal"
 
 def test_apply_rbj_lowpass_filter_stereo(white_noise_stereo, default_resonant_filter_params): # Renamed test
     """Test applying RBJ low-pass filter to a stereo signal."""
@@ -484,29 +478,27 @@ def test_apply_rbj_lowpass_filter_stereo(white_noise_stereo, default_resonant_fi
     assert filtered_signal.ndim == white_noise_stereo.ndim
     assert filtered_signal.shape[1] == 2
     assert filtered_signal.shape[0] == white_noise_stereo.shape[0]
-    assert not np.allclose(filtered_signal, white_noise_stereo), "RBJ low-pass filter did not alter stereo signal"
+    assert _differs(filtered_signal, white_noise_stereo), "RBJ low-pass filter did not alter stereo signal"
 
-def test_rbj_lowpass_filter_parameters_affect_output(white_noise_mono, default_resonant_filter_params): # Renamed test
+def test_rbj_lowpass_filter_parameters_affect_output(white_noise_mono, default_resonant_filter_params, lowpass_default_mono): # Renamed test
     """Test that changing RBJ low-pass filter parameters alters the output."""
-    filtered_default = apply_rbj_lowpass_filter(white_noise_mono, SAMPLE_RATE, default_resonant_filter_params) # Renamed function call
+    filtered_default = lowpass_default_mono
 
     # Change cutoff
     params_changed_cutoff = default_resonant_filter_params.model_copy(update={'cutoff_hz': 500.0})
     filtered_changed_cutoff = apply_rbj_lowpass_filter(white_noise_mono, SAMPLE_RATE, params_changed_cutoff) # Renamed function call
-    assert not np.allclose(filtered_default, filtered_changed_cutoff), "Changing cutoff frequency had no effect"
+    assert _differs(filtered_default, filtered_changed_cutoff), "Changing cutoff frequency had no effect"
 
     # Change resonance (q)
     params_changed_q = default_resonant_filter_params.model_copy(update={'q': 5.0}) # Use 'q'
     filtered_changed_q = apply_rbj_lowpass_filter(white_noise_mono, SAMPLE_RATE, params_changed_q) # Renamed function call
-    assert not np.allclose(filtered_default, filtered_changed_q), "Changing resonance (q) had no effect"
+    assert _differs(filtered_default, filtered_changed_q), "Changing resonance (q) had no effect"
 
-def test_rbj_lowpass_filter_attenuates_high_freq(white_noise_mono, default_resonant_filter_params): # Renamed test
+def test_rbj_lowpass_filter_attenuates_high_freq(white_noise_mono, lowpass_default_mono): # Renamed test
     """Conceptual test: RBJ low-pass should reduce overall energy (RMS)."""
-    filtered_signal = apply_rbj_lowpass_filter( # Renamed function call
-        white_noise_mono, SAMPLE_RATE, default_resonant_filter_params
-    )
-    rms_input = np.sqrt(np.mean(white_noise_mono**2))
-    rms_output = np.sqrt(np.mean(filtered_signal**2))
+    filtered_signal = lowpass_default_mono
+    rms_input = _rms(white_noise_mono)
+    rms_output = _rms(filtered_signal)
     assert rms_output < rms_input, "RBJ low-pass filter did not reduce RMS energy as expected"
 
 def test_rbj_lowpass_filter_zero_length_input(default_resonant_filter_params): # Renamed test
@@ -518,29 +510,24 @@ def test_rbj_lowpass_filter_zero_length_input(default_resonant_filter_params): #
     assert isinstance(filtered_signal, np.ndarray)
     assert len(filtered_signal) == 0
 
-def test_rbj_lowpass_filter_invalid_parameters(white_noise_mono): # Renamed test
+@pytest.mark.parametrize("kwargs", [
+    dict(cutoff_hz=-100.0, q=2.0), # Cutoff must be > 0
+    dict(cutoff_hz=1000.0, q=0.0), # Q must be > 0
+])
+def test_rbj_lowpass_filter_invalid_parameters(kwargs): # Renamed test
     """Test RBJ low-pass filter with invalid parameter values."""
-    with pytest.raises((ValidationError, ValueError)):
-        # Cutoff must be > 0
-        invalid_params = ResonantFilterParameters(cutoff_hz=-100.0, q=2.0) # Use 'q'
-        apply_rbj_lowpass_filter(white_noise_mono, SAMPLE_RATE, invalid_params) # Renamed function call
-
-    # Test Q=0 (must be > 0, should raise ValidationError)
     with pytest.raises(ValidationError):
-        invalid_params_q0 = ResonantFilterParameters(cutoff_hz=1000.0, q=0.0) # Use 'q'
-        # Instantiation should fail here, no need to call the filter function
+        ResonantFilterParameters(**kwargs)
 
 
 # -- Bandpass Filter Tests --
 
-def test_apply_bandpass_filter_mono(white_noise_mono, default_bandpass_filter_params):
+def test_apply_bandpass_filter_mono(white_noise_mono, bandpass_default_mono):
     """Test applying bandpass filter to a mono signal."""
-    filtered_signal = apply_bandpass_filter(
-        white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params # Uses default order=2
-    )
+    filtered_signal = bandpass_default_mono
     assert filtered_signal.ndim == white_noise_mono.ndim
     assert len(filtered_signal) == len(white_noise_mono)
-    assert not np.allclose(filtered_signal, white_noise_mono), "Bandpass filter did not alter mono signal"
+    assert _differs(filtered_signal, white_noise_mono), "Bandpass filter did not alter mono signal"
 
 def test_apply_bandpass_filter_stereo(white_noise_stereo, default_bandpass_filter_params):
     """Test applying bandpass filter to a stereo signal."""
@@ -550,35 +537,33 @@ def test_apply_bandpass_filter_stereo(white_noise_stereo, default_bandpass_filte
     assert filtered_signal.ndim == white_noise_stereo.ndim
     assert filtered_signal.shape[1] == 2
     assert filtered_signal.shape[0] == white_noise_stereo.shape[0]
-    assert not np.allclose(filtered_signal, white_noise_stereo), "Bandpass filter did not alter stereo signal"
+    assert _differs(filtered_signal, white_noise_stereo), "Bandpass filter did not alter stereo signal"
 
-def test_bandpass_filter_parameters_affect_output(white_noise_mono, default_bandpass_filter_params):
+def test_bandpass_filter_parameters_affect_output(white_noise_mono, default_bandpass_filter_params, bandpass_default_mono):
     """Test that changing bandpass filter parameters alters the output."""
-    filtered_default = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params) # Uses default order=2
+    filtered_default = bandpass_default_mono
 
     # Change center frequency
     params_changed_center = default_bandpass_filter_params.model_copy(update={'center_hz': 3000.0})
     filtered_changed_center = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, params_changed_center) # Uses default order=2
-    assert not np.allclose(filtered_default, filtered_changed_center), "Changing center frequency had no effect"
+    assert _differs(filtered_default, filtered_changed_center), "Changing center frequency had no effect"
 
     # Change Q
     params_changed_q = default_bandpass_filter_params.model_copy(update={'q': 5.0})
     filtered_changed_q = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, params_changed_q) # Uses default order=2
-    assert not np.allclose(filtered_default, filtered_changed_q), "Changing Q had no effect"
+    assert _differs(filtered_default, filtered_changed_q), "Changing Q had no effect"
 
     # Change order
     params_changed_order = default_bandpass_filter_params.model_copy(update={'order': 4})
     filtered_changed_order = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, params_changed_order)
-    assert not np.allclose(filtered_default, filtered_changed_order), "Changing order had no effect"
+    assert _differs(filtered_default, filtered_changed_order), "Changing order had no effect"
 
 
-def test_bandpass_filter_reduces_energy(white_noise_mono, default_bandpass_filter_params):
+def test_bandpass_filter_reduces_energy(white_noise_mono, bandpass_default_mono):
     """Conceptual test: Bandpass should reduce overall energy (RMS) compared to white noise."""
-    filtered_signal = apply_bandpass_filter(
-        white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params # Uses default order=2
-    )
-    rms_input = np.sqrt(np.mean(white_noise_mono**2))
-    rms_output = np.sqrt(np.mean(filtered_signal**2))
+    filtered_signal = bandpass_default_mono
+    rms_input = _rms(white_noise_mono)
+    rms_output = _rms(filtered_signal)
     assert rms_output < rms_input, "Bandpass filter did not reduce RMS energy as expected"
 
 def test_bandpass_filter_zero_length_input(default_bandpass_filter_params):
@@ -590,48 +575,85 @@ def test_bandpass_filter_zero_length_input(default_bandpass_filter_params):
     assert isinstance(filtered_signal, np.ndarray)
     assert len(filtered_signal) == 0
 
-def test_bandpass_filter_invalid_parameters(white_noise_mono):
+def test_filter_designs_are_reused_across_calls(white_noise_mono, default_bandpass_filter_params, default_resonant_filter_params):
+    """Test that repeated calls with the same settings reuse the cached SOS design."""
+    from robotic_psalms.synthesis.effects import _design_bandpass_sos, _design_rbj_lowpass_sos
+
+    first_bp = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params)
+    first_lp = apply_rbj_lowpass_filter(white_noise_mono, SAMPLE_RATE, default_resonant_filter_params)
+    bp_hits = _design_bandpass_sos.cache_info().hits
+    lp_hits = _design_rbj_lowpass_sos.cache_info().hits
+
+    second_bp = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params)
+    second_lp = apply_rbj_lowpass_filter(white_noise_mono, SAMPLE_RATE, default_resonant_filter_params)
+
+    assert _design_bandpass_sos.cache_info().hits == bp_hits + 1, "Bandpass design was not reused"
+    assert _design_rbj_lowpass_sos.cache_info().hits == lp_hits + 1, "Low-pass design was not reused"
+    np.testing.assert_array_equal(first_bp, second_bp)
+    np.testing.assert_array_equal(first_lp, second_lp)
+
+def test_single_pass_filter_state_is_reused(white_noise_mono, default_bandpass_filter_params):
+    """Test the causal path reuses the cached steady-state filter state for an unchanged design."""
+    from robotic_psalms.synthesis.effects import _sos_steady_state
+
+    first = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params, zero_phase=False)
+    hits = _sos_steady_state.cache_info().hits
+    second = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, default_bandpass_filter_params, zero_phase=False)
+
+    assert _sos_steady_state.cache_info().hits == hits + 1, "Steady-state filter state was not reused"
+    np.testing.assert_array_equal(first, second)
+
+@pytest.mark.parametrize("filter_func, params_fixture", [
+    (apply_rbj_lowpass_filter, "default_resonant_filter_params"),
+    (apply_bandpass_filter, "default_bandpass_filter_params"),
+])
+def test_filters_single_pass_mode(filter_func, params_fixture, white_noise_mono, white_noise_stereo, request):
+    """Test the causal (zero_phase=False) filter path keeps shape, filters, and accepts very short inputs."""
+    params = request.getfixturevalue(params_fixture)
+
+    causal_mono = filter_func(white_noise_mono, SAMPLE_RATE, params, zero_phase=False)
+    zero_phase_mono = filter_func(white_noise_mono, SAMPLE_RATE, params)
+    assert causal_mono.shape == white_noise_mono.shape
+    assert causal_mono.dtype == np.float32
+    assert _rms(causal_mono) < _rms(white_noise_mono), "Single-pass filter did not reduce RMS energy"
+    assert _differs(causal_mono, zero_phase_mono), "Single-pass output should differ from zero-phase output"
+
+    causal_stereo = filter_func(white_noise_stereo, SAMPLE_RATE, params, zero_phase=False)
+    assert causal_stereo.shape == white_noise_stereo.shape
+
+    # sosfiltfilt needs a minimum input length; the single causal pass does not
+    short_signal = white_noise_mono[:8]
+    causal_short = filter_func(short_signal, SAMPLE_RATE, params, zero_phase=False)
+    assert causal_short.shape == short_signal.shape
+
+@pytest.mark.parametrize("kwargs", [
+    dict(center_hz=-100.0, q=1.0, order=2), # Center frequency must be > 0
+    dict(center_hz=1500.0, q=0.0, order=2), # Q must be > 0
+    dict(center_hz=1500.0, q=1.0, order=0), # Order must be > 0
+])
+def test_bandpass_filter_invalid_parameters(kwargs):
     """Test bandpass filter with invalid parameter values."""
     with pytest.raises((ValidationError, ValueError)):
-        # Center frequency must be > 0
-        invalid_params = BandpassFilterParameters(center_hz=-100.0, q=1.0, order=2) # Added order
-        apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, invalid_params)
-
-    # Test Q=0 (must be > 0, should raise ValidationError)
-    with pytest.raises(ValidationError):
-        invalid_params_q0 = BandpassFilterParameters(center_hz=1500.0, q=0.0, order=2) # Added order
-        # Instantiation should fail here, no need to call the filter function
-    with pytest.raises((ValidationError, ValueError)):
-        # Order must be > 0
-        invalid_params = BandpassFilterParameters(center_hz=1500.0, q=1.0, order=0) # Added order
-        apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, invalid_params)
+        BandpassFilterParameters(**kwargs)
 
+def test_bandpass_filter_extreme_parameters_still_filter(white_noise_mono):
+    """Extreme but valid center/Q combinations are clamped rather than rejected."""
     # Test edge case where calculated low_cutoff >= high_cutoff (should not raise error, but print warning)
     # Example: Very high center frequency and very low Q
     # Note: The function now handles this by adjusting the range, so it shouldn't raise an error.
     # We can check if the output is different from the input, implying the filter was applied (even if adjusted).
     params_edge = BandpassFilterParameters(center_hz=SAMPLE_RATE * 0.499, q=0.1, order=2) # Center close to Nyquist
     filtered_signal = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, params_edge)
-    assert not np.allclose(filtered_signal, white_noise_mono, atol=1e-6), "Bandpass filter with extreme high center/low Q returned original signal unexpectedly"
+    assert _differs(filtered_signal, white_noise_mono, atol=1e-6), "Bandpass filter with extreme high center/low Q returned original signal unexpectedly"
 
     # Example: Very low center frequency and very low Q
     params_edge_low = BandpassFilterParameters(center_hz=1.0, q=0.1, order=2)
     filtered_signal_low = apply_bandpass_filter(white_noise_mono, SAMPLE_RATE, params_edge_low)
-    assert not np.allclose(filtered_signal_low, white_noise_mono, atol=1e-6), "Bandpass filter with low center/Q returned original signal unexpectedly"
+    assert _differs(filtered_signal_low, white_noise_mono, atol=1e-6), "Bandpass filter with low center/Q returned original signal unexpectedly"
 
 
 # --- Chorus Tests (REQ-ART-V03) ---
 
-def test_chorus_module_exists():
-    """Checks if the chorus imports work."""
-    assert callable(apply_chorus)
-    assert 'rate_hz' in ChorusParameters.model_fields
-    assert 'depth' in ChorusParameters.model_fields
-    assert 'delay_ms' in ChorusParameters.model_fields
-    assert 'feedback' in ChorusParameters.model_fields
-    assert 'num_voices' in ChorusParameters.model_fields
-    assert 'wet_dry_mix' in ChorusParameters.model_fields
-
 def test_apply_chorus_mono(dry_mono_signal, default_chorus_params):
     """Test applying chorus to a mono signal."""
     chorused_signal = apply_chorus(
@@ -639,7 +661,7 @@ def test_apply_chorus_mono(dry_mono_signal, default_chorus_params):
     )
     assert chorused_signal.ndim == dry_mono_signal.ndim
     assert len(chorused_signal) == len(dry_mono_signal)
-    assert not np.allclose(chorused_signal, dry_mono_signal), "Chorus did not alter mono signal"
+    assert _differs(chorused_signal, dry_mono_signal), "Chorus did not alter mono signal"
 
 def test_apply_chorus_stereo(dry_stereo_signal, default_chorus_params):
     """Test applying chorus to a stereo signal."""
@@ -649,42 +671,29 @@ def test_apply_chorus_stereo(dry_stereo_signal, default_chorus_params):
     assert chorused_signal.ndim == dry_stereo_signal.ndim
     assert chorused_signal.shape[1] == 2
     assert chorused_signal.shape[0] == dry_stereo_signal.shape[0]
-    assert not np.allclose(chorused_signal, dry_stereo_signal), "Chorus did not alter stereo signal"
-
-def test_chorus_parameters_affect_output(dry_mono_signal, default_chorus_params):
-    """Test that changing chorus parameters alters the output."""
-    chorused_default = apply_chorus(dry_mono_signal, SAMPLE_RATE, default_chorus_params)
-
-    # Change rate
-    params_changed_rate = default_chorus_params.model_copy(update={'rate_hz': 2.0})
-    chorused_changed_rate = apply_chorus(dry_mono_signal, SAMPLE_RATE, params_changed_rate)
-    assert not np.allclose(chorused_default, chorused_changed_rate), "Changing rate_hz had no effect"
-
-    # Change depth
-    params_changed_depth = default_chorus_params.model_copy(update={'depth': 0.8})
-    chorused_changed_depth = apply_chorus(dry_mono_signal, SAMPLE_RATE, params_changed_depth)
-    assert not np.allclose(chorused_default, chorused_changed_depth), "Changing depth had no effect"
-
-    # Change delay
-    params_changed_delay = default_chorus_params.model_copy(update={'delay_ms': 20.0})
-    chorused_changed_delay = apply_chorus(dry_mono_signal, SAMPLE_RATE, params_changed_delay)
-    assert not np.allclose(chorused_default, chorused_changed_delay), "Changing delay_ms had no effect"
-
-    # Change feedback
-    params_changed_feedback = default_chorus_params.model_copy(update={'feedback': 0.8})
-    chorused_changed_feedback = apply_chorus(dry_mono_signal, SAMPLE_RATE, params_changed_feedback)
-    assert not np.allclose(chorused_default, chorused_changed_feedback), "Changing feedback had no effect"
-
-    # Change num_voices
-    params_changed_voices = default_chorus_params.model_copy(update={'num_voices': 5})
-    chorused_changed_voices = apply_chorus(dry_mono_signal, SAMPLE_RATE, params_changed_voices)
-
-    assert not np.allclose(chorused_default, chorused_changed_voices), "Changing num_voices had no effect"
-
-    # Change wet_dry_mix
-    params_changed_mix = default_chorus_params.model_copy(update={'wet_dry_mix': 0.9})
-    chorused_changed_mix = apply_chorus(dry_mono_signal, SAMPLE_RATE, params_changed_mix)
-    assert not np.allclose(chorused_default, chorused_changed_mix), "Changing wet_dry_mix had no effect"
+    assert _differs(chorused_signal, dry_stereo_signal), "Chorus did not alter stereo signal"
+
+@pytest.fixture(scope="module")
+def chorused_mono(dry_mono_signal, default_chorus_params):
+    """`dry_mono_signal` through the default chorus and each single-parameter variant, computed once."""
+    variants = {
+        'default': {},
+        'rate_hz': {'rate_hz': 2.0},
+        'depth': {'depth': 0.8},
+        'delay_ms': {'delay_ms': 20.0},
+        'feedback': {'feedback': 0.8},
+        'num_voices': {'num_voices': 5},
+        'wet_dry_mix': {'wet_dry_mix': 0.9},
+    }
+    return {
+        name: apply_chorus(dry_mono_signal, SAMPLE_RATE, default_chorus_params.model_copy(update=update))
+        for name, update in variants.items()
+    }
+
+@pytest.mark.parametrize("field", ['rate_hz', 'depth', 'delay_ms', 'feedback', 'num_voices', 'wet_dry_mix'])
+def test_chorus_parameters_affect_output(chorused_mono, field):
+    """Test that changing each chorus parameter alters the output."""
+    assert _differs(chorused_mono['default'], chorused_mono[field]), f"Changing {field} had no effect"
 
 def test_chorus_zero_length_input(default_chorus_params):
     """Test chorus with zero-length audio input."""
@@ -731,13 +740,6 @@ def test_chorus_invalid_parameters(dry_mono_signal):
 
 # --- Smooth Spectral Freeze Tests (REQ-ART-E02) ---
 
-def test_spectral_freeze_module_exists():
-    """Checks if the spectral freeze imports work."""
-    assert callable(apply_smooth_spectral_freeze)
-    assert 'freeze_point' in SpectralFreezeParameters.model_fields
-    assert 'blend_amount' in SpectralFreezeParameters.model_fields
-    assert 'fade_duration' in SpectralFreezeParameters.model_fields
-
 def test_apply_spectral_freeze_mono(chirp_signal_mono, default_spectral_freeze_params):
     """Test applying spectral freeze to a mono signal."""
     frozen_signal = apply_smooth_spectral_freeze(
@@ -745,7 +747,7 @@ def test_apply_spectral_freeze_mono(chirp_signal_mono, default_spectral_freeze_p
     )
     assert frozen_signal.ndim == chirp_signal_mono.ndim
     assert len(frozen_signal) == len(chirp_signal_mono)
-    assert not np.allclose(frozen_signal, chirp_signal_mono), "Spectral freeze did not alter mono signal"
+    assert _differs(frozen_signal, chirp_signal_mono), "Spectral freeze did not alter mono signal"
 
 def test_apply_spectral_freeze_stereo(chirp_signal_mono, default_spectral_freeze_params):
     """Test applying spectral freeze to a stereo signal (created from mono)."""
@@ -756,7 +758,7 @@ def test_apply_spectral_freeze_stereo(chirp_signal_mono, default_spectral_freeze
     assert frozen_signal.ndim == stereo_chirp.ndim
     assert frozen_signal.shape[1] == 2
     assert frozen_signal.shape[0] == stereo_chirp.shape[0]
-    assert not np.allclose(frozen_signal, stereo_chirp), "Spectral freeze did not alter stereo signal"
+    assert _differs(frozen_signal, stereo_chirp), "Spectral freeze did not alter stereo signal"
 
 def test_spectral_freeze_sustains_texture(chirp_signal_mono, default_spectral_freeze_params):
     """Conceptual test: Output should have sustained energy after freeze point."""
@@ -775,10 +777,10 @@ def test_spectral_freeze_sustains_texture(chirp_signal_mono, default_spectral_fr
     if window_end > len(frozen_signal):
          pytest.skip("Signal too short after freeze point for RMS check")
 
-    rms_after_freeze = np.sqrt(np.mean(frozen_signal[window_start:window_end]**2))
+    rms_after_freeze = _rms(frozen_signal[window_start:window_end])
 
     # Compare with RMS energy near the end of the original chirp (which should be higher freq/potentially diff RMS)
-    rms_original_end = np.sqrt(np.mean(chirp_signal_mono[window_start:window_end]**2))
+    rms_original_end = _rms(chirp_signal_mono[window_start:window_end])
 
     # Basic check: RMS after freeze should be significant (not near zero)
     assert rms_after_freeze > 1e-6, "Frozen signal has near-zero energy after freeze point"
@@ -790,7 +792,7 @@ def test_spectral_freeze_freeze_point_parameter(chirp_signal_mono, default_spect
 
     params_early_freeze = default_spectral_freeze_params.model_copy(update={'freeze_point': 0.2})
     frozen_early = apply_smooth_spectral_freeze(chirp_signal_mono, SAMPLE_RATE, params_early_freeze)
-    assert not np.allclose(frozen_default, frozen_early), "Changing freeze_point had no effect"
+    assert _differs(frozen_default, frozen_early), "Changing freeze_point had no effect"
 
 def test_spectral_freeze_blend_amount_parameter(chirp_signal_mono, default_spectral_freeze_params):
     """Test that changing blend_amount mixes frozen/original signal."""
@@ -799,14 +801,14 @@ def test_spectral_freeze_blend_amount_parameter(chirp_signal_mono, default_spect
 
     params_half_blend = default_spectral_freeze_params.model_copy(update={'blend_amount': 0.5})
     frozen_half = apply_smooth_spectral_freeze(chirp_signal_mono, SAMPLE_RATE, params_half_blend)
-    assert not np.allclose(frozen_full, frozen_half), "Changing blend_amount (1.0 vs 0.5) had no effect"
+    assert _differs(frozen_full, frozen_half), "Changing blend_amount (1.0 vs 0.5) had no effect"
 
     params_no_freeze = default_spectral_freeze_params.model_copy(update={'blend_amount': 0.0})
     frozen_none = apply_smooth_spectral_freeze(chirp_signal_mono, SAMPLE_RATE, params_no_freeze)
     # Blend 0 should ideally be very close to the original signal, allowing for fade duration
     # This assertion might be too strict depending on implementation details (fade)
     # assert np.allclose(frozen_none, chirp_signal_mono, atol=1e-3), "Blend amount 0 did not result in original signal"
-    assert not np.allclose(frozen_full, frozen_none), "Changing blend_amount (1.0 vs 0.0) had no effect"
+    assert _differs(frozen_full, frozen_none), "Changing blend_amount (1.0 vs 0.0) had no effect"
 
 def test_spectral_freeze_fade_duration_parameter(chirp_signal_mono, default_spectral_freeze_params):
     """Test that changing fade_duration alters the output (conceptual)."""
@@ -815,7 +817,7 @@ def test_spectral_freeze_fade_duration_parameter(chirp_signal_mono, default_spec
     params_long_fade = default_spectral_freeze_params.model_copy(update={'fade_duration': 0.5})
     frozen_long_fade = apply_smooth_spectral_freeze(chirp_signal_mono, SAMPLE_RATE, params_long_fade)
     # Direct comparison is tricky. A longer fade should result in a different signal.
-    assert not np.allclose(frozen_default, frozen_long_fade), "Changing fade_duration had no effect"
+    assert _differs(frozen_default, frozen_long_fade), "Changing fade_duration had no effect"
     # More advanced test could analyze the RMS envelope around the freeze point
 
 def test_spectral_freeze_zero_length_input(default_spectral_freeze_params):
@@ -847,17 +849,6 @@ def test_spectral_freeze_invalid_parameters(chirp_signal_mono):
 
 # --- Refined Glitch Tests (REQ-ART-E03) ---
 
-def test_refined_glitch_module_exists():
-    """Checks if the refined glitch imports work."""
-    assert callable(apply_refined_glitch)
-    assert 'glitch_type' in GlitchParameters.model_fields
-    assert 'intensity' in GlitchParameters.model_fields
-    assert 'chunk_size_ms' in GlitchParameters.model_fields
-    assert 'repeat_count' in GlitchParameters.model_fields
-    assert 'tape_stop_speed' in GlitchParameters.model_fields
-    assert 'bitcrush_depth' in GlitchParameters.model_fields
-    assert 'bitcrush_rate_factor' in GlitchParameters.model_fields
-
 def test_apply_refined_glitch_mono(dry_mono_signal, default_glitch_params):
     """Test applying refined glitch to a mono signal (ensuring it runs)."""
     # Use intensity=1.0 to guarantee the glitch is applied for this assertion
@@ -867,7 +858,7 @@ def test_apply_refined_glitch_mono(dry_mono_signal, default_glitch_params):
     )
     assert glitched_signal.ndim == dry_mono_signal.ndim
     # Glitch might change length depending on type, so don't assert length equality strictly
-    assert not np.allclose(glitched_signal, dry_mono_signal), "Refined glitch (intensity=1.0) did not alter mono signal"
+    assert _differs(glitched_signal, dry_mono_signal), "Refined glitch (intensity=1.0) did not alter mono signal"
 
 def test_apply_refined_glitch_stereo(dry_stereo_signal, default_glitch_params):
     """Test applying refined glitch to a stereo signal (ensuring it runs)."""
@@ -878,7 +869,7 @@ def test_apply_refined_glitch_stereo(dry_stereo_signal, default_glitch_params):
     )
     assert glitched_signal.ndim == dry_stereo_signal.ndim
     assert glitched_signal.shape[1] == 2
-    assert not np.allclose(glitched_signal, dry_stereo_signal), "Refined glitch (intensity=1.0) did not alter stereo signal"
+    assert _differs(glitched_signal, dry_stereo_signal), "Refined glitch (intensity=1.0) did not alter stereo signal"
 
 def test_refined_glitch_intensity_zero(dry_mono_signal, default_glitch_params):
     """Test that intensity=0.0 results in no change."""
@@ -895,88 +886,45 @@ def test_refined_glitch_intensity_affects_output(dry_mono_signal, default_glitch
 
     params_high_intensity = default_glitch_params.model_copy(update={'intensity': 0.9})
     glitched_high = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_high_intensity)
-    assert not np.allclose(glitched_default, glitched_high), "Changing intensity (0.5 vs 0.9) had no effect"
+    assert _differs(glitched_default, glitched_high), "Changing intensity (0.5 vs 0.9) had no effect"
 
     params_low_intensity = default_glitch_params.model_copy(update={'intensity': 0.1})
     glitched_low = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_low_intensity)
-    assert not np.allclose(glitched_default, glitched_low), "Changing intensity (0.5 vs 0.1) had no effect"
-    assert not np.allclose(glitched_high, glitched_low), "Changing intensity (0.9 vs 0.1) had no effect"
+    assert _differs(glitched_default, glitched_low), "Changing intensity (0.5 vs 0.1) had no effect"
+    assert _differs(glitched_high, glitched_low), "Changing intensity (0.9 vs 0.1) had no effect"
 
 
-def test_refined_glitch_types_affect_output(dry_mono_signal, default_glitch_params):
-    """Test that different glitch_type values produce different outputs (ensuring glitches run)."""
-    # Use intensity=1.0 to guarantee glitches are applied for comparison
+@pytest.fixture(scope="module")
+def glitched_by_type(dry_mono_signal, default_glitch_params):
+    """`dry_mono_signal` through each glitch type at intensity=1.0 (guaranteeing glitches run), computed once."""
     base_params = default_glitch_params.model_copy(update={'intensity': 1.0})
-    glitched_repeat = apply_refined_glitch(
-        dry_mono_signal, SAMPLE_RATE, base_params.model_copy(update={'glitch_type': 'repeat'})
-    )
-    glitched_stutter = apply_refined_glitch(
-        dry_mono_signal, SAMPLE_RATE, base_params.model_copy(update={'glitch_type': 'stutter'})
-    )
-    glitched_tape_stop = apply_refined_glitch(
-        dry_mono_signal, SAMPLE_RATE, base_params.model_copy(update={'glitch_type': 'tape_stop'})
-    )
-    glitched_bitcrush = apply_refined_glitch(
-        dry_mono_signal, SAMPLE_RATE, base_params.model_copy(update={'glitch_type': 'bitcrush'})
-    )
+    return {
+        glitch_type: apply_refined_glitch(
+            dry_mono_signal, SAMPLE_RATE, base_params.model_copy(update={'glitch_type': glitch_type})
+        )
+        for glitch_type in ('repeat', 'stutter', 'tape_stop', 'bitcrush')
+    }
 
-    assert not np.allclose(glitched_repeat, glitched_stutter), "Repeat vs Stutter produced same output"
-    assert not np.allclose(glitched_repeat, glitched_tape_stop), "Repeat vs Tape Stop produced same output"
-    assert not np.allclose(glitched_repeat, glitched_bitcrush), "Repeat vs Bitcrush produced same output"
-    assert not np.allclose(glitched_stutter, glitched_tape_stop), "Stutter vs Tape Stop produced same output"
+def test_refined_glitch_types_affect_output(glitched_by_type):
+    """Test that different glitch_type values produce different outputs (ensuring glitches run)."""
+    assert _differs(glitched_by_type['repeat'], glitched_by_type['stutter']), "Repeat vs Stutter produced same output"
+    assert _differs(glitched_by_type['repeat'], glitched_by_type['tape_stop']), "Repeat vs Tape Stop produced same output"
+    assert _differs(glitched_by_type['repeat'], glitched_by_type['bitcrush']), "Repeat vs Bitcrush produced same output"
+    assert _differs(glitched_by_type['stutter'], glitched_by_type['tape_stop']), "Stutter vs Tape Stop produced same output"
     # Note: Depending on implementation, some types might be similar at certain settings
 
-def test_refined_glitch_chunk_size_affects_output(dry_mono_signal, default_glitch_params):
-    """Test that chunk_size_ms affects output for relevant types (repeat/stutter) (ensuring glitches run)."""
-    # Use intensity=1.0 to guarantee glitches are applied for comparison
-    params_repeat = default_glitch_params.model_copy(update={'glitch_type': 'repeat', 'intensity': 1.0})
-    glitched_default = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_repeat)
-
-    params_changed = params_repeat.model_copy(update={'chunk_size_ms': 10.0})
-    glitched_changed = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(glitched_default, glitched_changed), "Changing chunk_size_ms had no effect for 'repeat' (intensity=1.0)"
-
-    # Could add similar check for 'stutter' if needed
-
-def test_refined_glitch_repeat_count_affects_output(dry_mono_signal, default_glitch_params):
-    """Test that repeat_count affects output for relevant types (repeat) (ensuring glitches run)."""
-    # Use intensity=1.0 to guarantee glitches are applied for comparison
-    params_repeat = default_glitch_params.model_copy(update={'glitch_type': 'repeat', 'intensity': 1.0})
-    glitched_default = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_repeat)
-
-    params_changed = params_repeat.model_copy(update={'repeat_count': 5})
+@pytest.mark.parametrize("glitch_type, field, value", [
+    ('repeat', 'chunk_size_ms', 10.0), # Could add a similar check for 'stutter' if needed
+    ('repeat', 'repeat_count', 5),
+    ('tape_stop', 'tape_stop_speed', 0.5),
+    ('bitcrush', 'bitcrush_depth', 4),
+    ('bitcrush', 'bitcrush_rate_factor', 0.1),
+])
+def test_refined_glitch_type_parameters_affect_output(dry_mono_signal, default_glitch_params, glitched_by_type, glitch_type, field, value):
+    """Test that each type's own parameter affects its output (intensity=1.0, so glitches run)."""
+    params_changed = default_glitch_params.model_copy(update={'glitch_type': glitch_type, 'intensity': 1.0, field: value})
     glitched_changed = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(glitched_default, glitched_changed), "Changing repeat_count had no effect for 'repeat' (intensity=1.0)"
-
-def test_refined_glitch_tape_stop_speed_affects_output(dry_mono_signal, default_glitch_params):
-    """Test that tape_stop_speed affects output for 'tape_stop' type (ensuring glitches run)."""
-    # Use intensity=1.0 to guarantee glitches are applied for comparison
-    params_tape_stop = default_glitch_params.model_copy(update={'glitch_type': 'tape_stop', 'intensity': 1.0})
-    glitched_default = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_tape_stop)
-
-    params_changed = params_tape_stop.model_copy(update={'tape_stop_speed': 0.5})
-    glitched_changed = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(glitched_default, glitched_changed), "Changing tape_stop_speed had no effect for 'tape_stop' (intensity=1.0)"
-
-def test_refined_glitch_bitcrush_depth_affects_output(dry_mono_signal, default_glitch_params):
-    """Test that bitcrush_depth affects output for 'bitcrush' type (ensuring glitches run)."""
-    # Use intensity=1.0 to guarantee glitches are applied for comparison
-    params_bitcrush = default_glitch_params.model_copy(update={'glitch_type': 'bitcrush', 'intensity': 1.0})
-    glitched_default = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_bitcrush)
-
-    params_changed = params_bitcrush.model_copy(update={'bitcrush_depth': 4})
-    glitched_changed = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(glitched_default, glitched_changed), "Changing bitcrush_depth had no effect for 'bitcrush' (intensity=1.0)"
-
-def test_refined_glitch_bitcrush_rate_factor_affects_output(dry_mono_signal, default_glitch_params):
-    """Test that bitcrush_rate_factor affects output for 'bitcrush' type (ensuring glitches run)."""
-    # Use intensity=1.0 to guarantee glitches are applied for comparison
-    params_bitcrush = default_glitch_params.model_copy(update={'glitch_type': 'bitcrush', 'intensity': 1.0})
-    glitched_default = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_bitcrush)
-
-    params_changed = params_bitcrush.model_copy(update={'bitcrush_rate_factor': 0.1})
-    glitched_changed = apply_refined_glitch(dry_mono_signal, SAMPLE_RATE, params_changed)
-    assert not np.allclose(glitched_default, glitched_changed), "Changing bitcrush_rate_factor had no effect for 'bitcrush' (intensity=1.0)"
+    assert _differs(glitched_by_type[glitch_type], glitched_changed), f"Changing {field} had no effect for '{glitch_type}' (intensity=1.0)"
 
 
 def test_refined_glitch_zero_length_input(default_glitch_params):
@@ -1028,14 +976,6 @@ def test_refined_glitch_invalid_parameters(dry_mono_signal):
 
 # --- Saturation/Distortion Tests (REQ-ART-E04) ---
 
-def test_saturation_module_exists():
-    """Checks if the saturation imports work."""
-    assert callable(apply_saturation)
-    assert 'drive' in SaturationParameters.model_fields
-    assert 'tone' in SaturationParameters.model_fields
-    assert 'mix' in SaturationParameters.model_fields
-    # assert 'saturation_type' in SaturationParameters.model_fields # Optional
-
 def test_apply_saturation_mono(dry_mono_signal, default_saturation_params):
     """Test applying saturation to a mono signal."""
     saturated_signal = apply_saturation(
@@ -1043,7 +983,7 @@ def test_apply_saturation_mono(dry_mono_signal, default_saturation_params):
     )
     assert saturated_signal.ndim == dry_mono_signal.ndim
     assert len(saturated_signal) == len(dry_mono_signal)
-    assert not np.allclose(saturated_signal, dry_mono_signal), "Saturation did not alter mono signal"
+    assert _differs(saturated_signal, dry_mono_signal), "Saturation did not alter mono signal"
 
 def test_apply_saturation_stereo(dry_stereo_signal, default_saturation_params):
     """Test applying saturation to a stereo signal."""
@@ -1053,12 +993,12 @@ def test_apply_saturation_stereo(dry_stereo_signal, default_saturation_params):
     assert saturated_signal.ndim == dry_stereo_signal.ndim
     assert saturated_signal.shape[1] == 2
     assert saturated_signal.shape[0] == dry_stereo_signal.shape[0]
-    assert not np.allclose(saturated_signal, dry_stereo_signal), "Saturation did not alter stereo signal"
+    assert _differs(saturated_signal, dry_stereo_signal), "Saturation did not alter stereo signal"
 
 def test_saturation_adds_harmonics(dry_mono_signal, default_saturation_params):
     """Conceptual test: Saturation should add harmonic content."""
-    input_fft = np.fft.fft(dry_mono_signal)
-    input_freq = np.fft.fftfreq(len(dry_mono_signal), 1 / SAMPLE_RATE)
+    # Real input, so the non-negative half of the spectrum holds every peak
+    input_fft = rfft(dry_mono_signal, workers=-1)
     # Find prominent peaks (arbitrary threshold: > 10% of max amplitude)
     input_peaks = np.where(np.abs(input_fft) > np.max(np.abs(input_fft)) * 0.1)[0]
 
@@ -1069,7 +1009,7 @@ def test_saturation_adds_harmonics(dry_mono_signal, default_saturation_params):
     saturated_signal = apply_saturation(
         dry_mono_signal, SAMPLE_RATE, params_high_drive
     )
-    output_fft = np.fft.fft(saturated_signal)
+    output_fft = rfft(saturated_signal, workers=-1)
     # Find prominent peaks in output (using the same arbitrary threshold)
     output_peaks = np.where(np.abs(output_fft) > np.max(np.abs(output_fft)) * 0.1)[0]
 
@@ -1079,38 +1019,36 @@ def test_saturation_adds_harmonics(dry_mono_signal, default_saturation_params):
     assert len(output_peaks) > len(input_peaks) or not np.allclose(input_peaks, output_peaks), \
         "Saturation did not appear to add/change significant harmonic content (peak count/location check)"
 
-def test_saturation_parameters_affect_output(dry_mono_signal, default_saturation_params):
+@pytest.fixture(scope="module")
+def saturated_mono(dry_mono_signal, default_saturation_params):
+    """`dry_mono_signal` through the default saturation and each single-parameter variant, computed once."""
+    # Distinct values compared to the defaults (0.5); tone is conceptual (assumes it affects frequency content)
+    variants = {
+        'default': {},
+        'high_drive': {'drive': 5.0},
+        'dark_tone': {'tone': 0.1},
+        'high_mix': {'mix': 0.9},
+        'low_mix': {'mix': 0.1},
+    }
+    return {
+        name: apply_saturation(dry_mono_signal, SAMPLE_RATE, default_saturation_params.model_copy(update=update))
+        for name, update in variants.items()
+    }
+
+@pytest.mark.parametrize("variant, label", [
+    ('high_drive', "drive"),
+    ('dark_tone', "tone"),
+    ('high_mix', "mix"),
+    ('low_mix', "mix (low)"),
+])
+def test_saturation_parameters_affect_output(saturated_mono, variant, label):
     """Test that changing saturation parameters alters the output."""
-    saturated_default = apply_saturation(dry_mono_signal, SAMPLE_RATE, default_saturation_params)
-
-    # Change drive
-    # Use a more distinct drive value compared to the default (0.5)
-    params_high_drive = default_saturation_params.model_copy(update={'drive': 5.0})
-    saturated_high_drive = apply_saturation(dry_mono_signal, SAMPLE_RATE, params_high_drive)
-    assert not np.allclose(saturated_default, saturated_high_drive), "Changing drive had no effect"
-
-    # Change tone (conceptual - assumes tone affects frequency content)
-    # Use a more distinct tone value compared to the default (0.5)
-    params_dark_tone = default_saturation_params.model_copy(update={'tone': 0.1})
-    saturated_dark_tone = apply_saturation(dry_mono_signal, SAMPLE_RATE, params_dark_tone)
-    assert not np.allclose(saturated_default, saturated_dark_tone), "Changing tone had no effect"
-
-    # Change mix
-    # Use a more distinct mix value compared to the default (0.5)
-    params_high_mix = default_saturation_params.model_copy(update={'mix': 0.9})
-    saturated_high_mix = apply_saturation(dry_mono_signal, SAMPLE_RATE, params_high_mix)
-    assert not np.allclose(saturated_default, saturated_high_mix), "Changing mix had no effect"
-
-    # Use a more distinct low mix value compared to the default (0.5)
-    params_low_mix = default_saturation_params.model_copy(update={'mix': 0.1})
-    saturated_low_mix = apply_saturation(dry_mono_signal, SAMPLE_RATE, params_low_mix)
-    assert not np.allclose(saturated_default, saturated_low_mix), "Changing mix (low) had no effect"
-    assert not np.allclose(saturated_high_mix, saturated_low_mix), "Changing mix (high vs low) had no effect"
-
-    # Optional: Test saturation_type if implemented
-    # params_alt_type = default_saturation_params.model_copy(update={'saturation_type': 'soft_clip'})
-    # saturated_alt_type = apply_saturation(dry_mono_signal, SAMPLE_RATE, params_alt_type)
-    # assert not np.allclose(saturated_default, saturated_alt_type), "Changing saturation_type had no effect"
+    assert _differs(saturated_mono['default'], saturated_mono[variant]), f"Changing {label} had no effect"
+
+    # Optional: Test saturation_type if implemented, e.g. a {'saturation_type': 'soft_clip'} variant
+
+def test_saturation_mix_levels_differ(saturated_mono):
+    assert _differs(saturated_mono['high_mix'], saturated_mono['low_mix']), "Changing mix (high vs low) had no effect"
 
 def test_saturation_zero_length_input(default_saturation_params):
     """Test saturation with zero-length audio input."""
@@ -1147,12 +1085,6 @@ def test_saturation_invalid_parameters(dry_mono_signal):
 
 # --- Master Dynamics Tests (REQ-ART-M01) ---
 
-def test_master_dynamics_module_exists():
-    """Checks if the master dynamics imports work."""
-    assert callable(apply_master_dynamics)
-    assert 'compressor_threshold_db' in MasterDynamicsParameters.model_fields
-    assert 'limiter_threshold_db' in MasterDynamicsParameters.model_fields
-
 def test_apply_master_dynamics_mono(dynamic_signal_mono, default_master_dynamics_params):
     """Test applying master dynamics to a mono signal."""
     processed_signal = apply_master_dynamics(
@@ -1160,7 +1092,7 @@ def test_apply_master_dynamics_mono(dynamic_signal_mono, default_master_dynamics
     )
     assert processed_signal.ndim == dynamic_signal_mono.ndim
     assert len(processed_signal) == len(dynamic_signal_mono)
-    assert not np.allclose(processed_signal, dynamic_signal_mono), "Master dynamics did not alter mono signal"
+    assert _differs(processed_signal, dynamic_signal_mono), "Master dynamics did not alter mono signal"
 
 def test_apply_master_dynamics_stereo(dynamic_signal_mono, default_master_dynamics_params):
     """Test applying master dynamics to a stereo signal."""
@@ -1171,7 +1103,7 @@ def test_apply_master_dynamics_stereo(dynamic_signal_mono, default_master_dynami
     assert processed_signal.ndim == stereo_signal.ndim
     assert processed_signal.shape[1] == 2
     assert processed_signal.shape[0] == stereo_signal.shape[0]
-    assert not np.allclose(processed_signal, stereo_signal), "Master dynamics did not alter stereo signal"
+    assert _differs(processed_signal, stereo_signal), "Master dynamics did not alter stereo signal"
 
 def test_master_dynamics_compression_reduces_dynamic_range(dynamic_signal_mono, default_master_dynamics_params):
     """Test that compression reduces the dynamic range."""
@@ -1183,10 +1115,10 @@ def test_master_dynamics_compression_reduces_dynamic_range(dynamic_signal_mono,
     num_samples = len(dynamic_signal_mono)
     half_samples = num_samples // 2
 
-    rms_quiet_in = np.sqrt(np.mean(dynamic_signal_mono[:half_samples]**2))
-    rms_loud_in = np.sqrt(np.mean(dynamic_signal_mono[half_samples:]**2))
-    rms_quiet_out = np.sqrt(np.mean(processed_signal[:half_samples]**2))
-    rms_loud_out = np.sqrt(np.mean(processed_signal[half_samples:]**2))
+    rms_quiet_in = _rms(dynamic_signal_mono[:half_samples])
+    rms_loud_in = _rms(dynamic_signal_mono[half_samples:])
+    rms_quiet_out = _rms(processed_signal[:half_samples])
+    rms_loud_out = _rms(processed_signal[half_samples:])
 
     # Avoid division by zero if input is silent
     if rms_quiet_in < 1e-9 or rms_quiet_out < 1e-9:
@@ -1244,17 +1176,17 @@ def test_master_dynamics_parameters_affect_output(dynamic_signal_mono, default_m
     # Change compressor threshold
     params_comp_thresh = default_master_dynamics_params.model_copy(update={'compressor_threshold_db': -10.0})
     processed_comp_thresh = apply_master_dynamics(dynamic_signal_mono, SAMPLE_RATE, params_comp_thresh)
-    assert not np.allclose(processed_default, processed_comp_thresh), "Changing compressor threshold had no effect"
+    assert _differs(processed_default, processed_comp_thresh), "Changing compressor threshold had no effect"
 
     # Change compressor ratio
     params_comp_ratio = default_master_dynamics_params.model_copy(update={'compressor_ratio': 10.0})
     processed_comp_ratio = apply_master_dynamics(dynamic_signal_mono, SAMPLE_RATE, params_comp_ratio)
-    assert not np.allclose(processed_default, processed_comp_ratio), "Changing compressor ratio had no effect"
+    assert _differs(processed_default, processed_comp_ratio), "Changing compressor ratio had no effect"
 
     # Change limiter threshold
     params_lim_thresh = default_master_dynamics_params.model_copy(update={'limiter_threshold_db': -6.0})
     processed_lim_thresh = apply_master_dynamics(dynamic_signal_mono, SAMPLE_RATE, params_lim_thresh)
-    assert not np.allclose(processed_default, processed_lim_thresh), "Changing limiter threshold had no effect"
+    assert _differs(processed_default, processed_lim_thresh), "Changing limiter threshold had no effect"
 # Removed makeup_gain_db test as it's no longer a parameter
 
 def test_master_dynamics_bypass(dynamic_signal_mono, default_master_dynamics_params):
@@ -107,4 +107,88 @@ def test_parse_midi_melody_index_out_of_bounds():
     """
     # multi_track.mid has 2 instruments (indices 0 and 1)
     melody = parse_midi_melody(MULTI_TRACK_MIDI_PATH, instrument_index=5)
-    assert melody == []
\ No newline at end of file
+    assert melody == []
+
+
+def test_parse_midi_melody_sorts_and_skips_invalid_notes(tmp_path):
+    """
+    Test notes are returned in start order, with zero-pitch and zero-length notes dropped.
+    """
+    import pretty_midi
+    midi = pretty_midi.PrettyMIDI()
+    instrument = pretty_midi.Instrument(program=0)
+    instrument.notes = [
+        pretty_midi.Note(velocity=100, pitch=64, start=1.0, end=1.5), # E4, added out of order
+        pretty_midi.Note(velocity=100, pitch=60, start=0.0, end=0.5), # C4
+        pretty_midi.Note(velocity=100, pitch=0, start=0.5, end=1.0), # Invalid pitch
+        pretty_midi.Note(velocity=100, pitch=62, start=1.5, end=1.5), # Zero duration
+    ]
+    midi.instruments.append(instrument)
+    midi_path = tmp_path / "unsorted.mid"
+    midi.write(str(midi_path))
+
+    melody = parse_midi_melody(str(midi_path))
+    assert melody == [
+        (pytest.approx(261.63, abs=0.01), pytest.approx(0.5)),
+        (pytest.approx(329.63, abs=0.01), pytest.approx(0.5)),
+    ]
+    assert all(isinstance(pitch, float) and isinstance(duration, float) for pitch, duration in melody)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_midi_melodies_matches_single_parses(workers):
+    """
+    Test batch parsing returns one melody per path, in order, like parsing each file.
+    """
+    from robotic_psalms.utils.midi_parser import parse_midi_melodies
+    paths = [VALID_MIDI_PATH, MULTI_TRACK_MIDI_PATH, EMPTY_MIDI_PATH]
+    melodies = parse_midi_melodies(paths, workers=workers)
+    assert melodies == [parse_midi_melody(path) for path in paths]
+
+def test_parse_midi_melodies_propagates_errors():
+    """
+    Test a missing file in a batch raises FileNotFoundError, as for a single parse.
+    """
+    from robotic_psalms.utils.midi_parser import parse_midi_melodies
+    with pytest.raises(FileNotFoundError):
+        parse_midi_melodies([VALID_MIDI_PATH, NON_EXISTENT_PATH], workers=2)
+
+def test_parse_midi_melody_caches_until_file_changes(tmp_path):
+    """
+    Test a repeated parse is served from the cache, returns an independent list,
+    and is re-parsed once the file is rewritten.
+    """
+    import os
+    import shutil
+    from unittest.mock import patch
+    import pretty_midi
+    midi_path = tmp_path / "cached.mid"
+    shutil.copy(VALID_MIDI_PATH, midi_path)
+
+    with patch('robotic_psalms.utils.midi_parser.pretty_midi.PrettyMIDI', wraps=pretty_midi.PrettyMIDI) as mock_midi:
+        first = parse_midi_melody(str(midi_path))
+        first.clear() # Mutating a result must not affect the cache
+        second = parse_midi_melody(str(midi_path))
+        assert mock_midi.call_count == 1
+        assert len(second) == 4
+
+        shutil.copy(MULTI_TRACK_MIDI_PATH, midi_path)
+        os.utime(midi_path, ns=(0, os.stat(midi_path).st_mtime_ns + 1_000_000_000))
+        third = parse_midi_melody(str(midi_path))
+        assert mock_midi.call_count == 2
+        assert len(third) == 3
+
+def test_parse_midi_melody_array_matches_list():
+    """
+    Test the array form holds the same (pitch_hz, duration_sec) rows as the list form
+    and can be modified without affecting later parses.
+    """
+    import numpy as np
+    from robotic_psalms.utils.midi_parser import parse_midi_melody_array
+    melody_array = parse_midi_melody_array(MULTI_TRACK_MIDI_PATH, instrument_index=1)
+    assert melody_array.shape == (3, 2)
+    assert melody_array.dtype == np.float64
+    np.testing.assert_array_equal(melody_array, np.array(parse_midi_melody(MULTI_TRACK_MIDI_PATH, instrument_index=1)))
+
+    melody_array[:] = 0.0
+    assert parse_midi_melody_array(MULTI_TRACK_MIDI_PATH, instrument_index=1)[0, 0] == pytest.approx(523.25, abs=0.01)
+    assert parse_midi_melody_array(EMPTY_MIDI_PATH).shape == (0, 2)